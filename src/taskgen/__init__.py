@@ -1,9 +1,16 @@
-from taskgen.config import (
-    CleanConfig,
-    CreateConfig,
-    FarmConfig,
-    ValidateConfig,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from taskgen._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from taskgen.config import (
+        CleanConfig,
+        CreateConfig,
+        FarmConfig,
+        ValidateConfig,
+    )
 
 __version__ = "0.1.0"
 
@@ -14,3 +21,15 @@ __all__ = [
     "CleanConfig",
     "__version__",
 ]
+
+# taskgen.config imports harbor, so resolve the config classes on first access
+# instead of paying for it on every `import taskgen` (i.e. every CLI launch).
+__getattr__ = lazy_getattr(
+    globals(),
+    {
+        "CreateConfig": "taskgen.config",
+        "FarmConfig": "taskgen.config",
+        "ValidateConfig": "taskgen.config",
+        "CleanConfig": "taskgen.config",
+    },
+)
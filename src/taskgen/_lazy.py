@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_getattr(namespace: dict[str, Any], sources: dict[str, str]) -> Callable[[str], Any]:
+    """Build a module-level __getattr__ that imports names on first access.
+
+    Args:
+        namespace: The calling module's globals(); resolved names are cached there
+        sources: Maps each exported name to the module that defines it
+
+    Returns:
+        A function to bind as the module's __getattr__
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name in sources:
+            value = getattr(importlib.import_module(sources[name]), name)
+            namespace[name] = value
+            return value
+        raise AttributeError(f"module {namespace['__name__']!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -1,13 +1,20 @@
-from taskgen.analyze.models import (
-    BaselineResult,
-    BaselineValidation,
-    Classification,
-    Subtype,
-    TaskVerdict,
-    TrialClassification,
-)
-from taskgen.analyze.classifier import TrialClassifier, write_trial_analysis_files
-from taskgen.analyze.run import AnalyzeArgs, AnalysisResult, run_analyze
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from taskgen._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from taskgen.analyze.classifier import TrialClassifier, write_trial_analysis_files
+    from taskgen.analyze.models import (
+        BaselineResult,
+        BaselineValidation,
+        Classification,
+        Subtype,
+        TaskVerdict,
+        TrialClassification,
+    )
+    from taskgen.analyze.run import AnalysisResult, AnalyzeArgs, run_analyze
 
 __all__ = [
     "AnalysisResult",
@@ -22,3 +29,22 @@ __all__ = [
     "run_analyze",
     "write_trial_analysis_files",
 ]
+
+# The classifier and runner pull in the Claude Agent SDK and Harbor, so the
+# public names are resolved on first access instead of at package import.
+__getattr__ = lazy_getattr(
+    globals(),
+    {
+        "BaselineResult": "taskgen.analyze.models",
+        "BaselineValidation": "taskgen.analyze.models",
+        "Classification": "taskgen.analyze.models",
+        "Subtype": "taskgen.analyze.models",
+        "TaskVerdict": "taskgen.analyze.models",
+        "TrialClassification": "taskgen.analyze.models",
+        "TrialClassifier": "taskgen.analyze.classifier",
+        "write_trial_analysis_files": "taskgen.analyze.classifier",
+        "AnalysisResult": "taskgen.analyze.run",
+        "AnalyzeArgs": "taskgen.analyze.run",
+        "run_analyze": "taskgen.analyze.run",
+    },
+)
@@ -40,7 +40,7 @@ def write_trial_analysis_files(
     task_id: str,
     agent: str,
     model: str,
-) -> None:
+) -> dict[str, str]:
     """Write trajectory analysis files to trial directory.
     
     Creates three files in the trial directory:
@@ -54,6 +54,10 @@ def write_trial_analysis_files(
         task_id: Task identifier
         agent: Agent name
         model: Model name
+
+    Returns:
+        The payload written to trajectory-analysis.json, for callers that also
+        emit it elsewhere (e.g. as a compact line on stdout)
     """
     import json
     
@@ -69,9 +73,8 @@ def write_trial_analysis_files(
         "recommendation": classification.recommendation,
     }
     
-    (trial_dir / "trajectory-analysis.json").write_text(
-        json.dumps(json_data, indent=2)
-    )
+    json_bytes = json.dumps(json_data, indent=2).encode()
+    (trial_dir / "trajectory-analysis.json").write_bytes(json_bytes)
     
     # Write markdown
     md_content = f"""# Trajectory Analysis
@@ -98,9 +101,9 @@ def write_trial_analysis_files(
     (trial_dir / "trajectory-analysis.md").write_text(md_content)
     
     # Write raw (same as JSON for now, could include full SDK response)
-    (trial_dir / "trajectory-analysis-raw.json").write_text(
-        json.dumps(json_data, indent=2)
-    )
+    (trial_dir / "trajectory-analysis-raw.json").write_bytes(json_bytes)
+
+    return json_data
 
 
 class TrialClassifier:
@@ -185,7 +188,7 @@ class TrialClassifier:
             )
         
         try:
-            result = TrialResult.model_validate_json(result_path.read_text())
+            result = TrialResult.model_validate_json(result_path.read_bytes())
         except Exception as e:
             return TrialClassification(
                 trial_name=trial_dir.name,
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import re
 import subprocess
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from harbor.models.trial.result import TrialResult
 from harbor.models.environment_type import EnvironmentType
+from pydantic import BaseModel
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 from rich.table import Table
@@ -32,6 +38,18 @@ from taskgen.tools.harbor_runner import (
     run_harbor_agent,
 )
 
+# Quality-check table rows that report a failure
+_FAIL_LINE_RE = re.compile("fail|FAIL|❌")
+_PASSED_RE = re.compile("passed", re.I)
+
+# (icon, style) per classification in the report; anything else is ("⚫", "dim")
+_CLASSIFICATION_STYLES = {
+    Classification.GOOD_SUCCESS: ("✅", "green"),
+    Classification.GOOD_FAILURE: ("⚪", "dim"),
+    Classification.BAD_SUCCESS: ("🔴", "red"),
+    Classification.BAD_FAILURE: ("🟡", "yellow"),
+}
+
 
 def _setup_claude_auth_preference(console: Console) -> None:
     """Setup Claude Code to prefer OAuth token over API key.
@@ -72,6 +90,27 @@ class TrialOutcome:
     exception_message: str | None
 
 
+class _SlimVerifierResult(BaseModel):
+    rewards: dict[str, float] | None = None
+
+
+class _SlimExceptionInfo(BaseModel):
+    exception_type: str | None = None
+    exception_message: str | None = None
+
+
+class _SlimTrialResult(BaseModel):
+    """The few fields of Harbor's TrialResult that TrialOutcome needs.
+
+    Validating only these (unknown keys are ignored) is much cheaper than the full
+    TrialResult schema, whose agent/environment sections are never read here.
+    """
+
+    trial_name: str
+    verifier_result: _SlimVerifierResult | None = None
+    exception_info: _SlimExceptionInfo | None = None
+
+
 @dataclass
 class QualityCheckResult:
     """Result of static quality check."""
@@ -117,7 +156,7 @@ class AnalyzeArgs:
     agent: str = "claude-code"
     model: str = "anthropic/claude-sonnet-4-5"
     n_trials: int = 3
-    n_concurrent: int = 1  # Number of concurrent trials (matches Harbor's -n flag)
+    n_concurrent: int | None = None  # Concurrent trials (Harbor's -n); None = min(n_trials, 4)
     jobs_dir: Path = Path(".state/analyze-jobs")
     skip_quality_check: bool = False
     skip_baseline: bool = False  # Skip baseline validation (nop/oracle)
@@ -129,6 +168,12 @@ class AnalyzeArgs:
     classification_timeout: int = 300  # Timeout per classification in seconds (5 min default)
     verdict_timeout: int = 180  # Timeout for verdict synthesis in seconds (3 min default)
     save_to_dir: bool = False  # Write trajectory-analysis.{md,json} to each trial dir
+    no_cache: bool = False  # Re-run the quality check even if the task is unchanged
+
+    def __post_init__(self) -> None:
+        # Trials are independent agent sessions, so run them in parallel by default
+        if self.n_concurrent is None:
+            self.n_concurrent = max(1, min(self.n_trials, 4))
 
 
 def run_analyze(args: AnalyzeArgs) -> AnalysisResult:
@@ -169,6 +214,22 @@ def run_analyze(args: AnalyzeArgs) -> AnalysisResult:
     return result
 
 
+def _tally_outcomes(outcomes: list[TrialOutcome]) -> tuple[int, int, int]:
+    """Count (passed, failed, errored) trials in one pass.
+
+    A trial that raised is counted as an error in addition to its reward, if any.
+    """
+    successes = failures = errors = 0
+    for t in outcomes:
+        if t.reward == 1:
+            successes += 1
+        elif t.reward is not None:
+            failures += 1
+        if t.exception_type:
+            errors += 1
+    return successes, failures, errors
+
+
 def _run_analysis(
     args: AnalyzeArgs,
     task_id: str,
@@ -182,7 +243,12 @@ def _run_analysis(
     quality_check = None
     if not args.skip_quality_check:
         console.print("\n[bold blue]Step 1/4: Static Quality Check[/bold blue]")
-        quality_check = _run_quality_check(task_path, args.analysis_model, console)
+        quality_check = _run_quality_check(
+            task_path,
+            args.analysis_model,
+            console,
+            cache_dir=None if args.no_cache else args.jobs_dir.parent / "analyze-cache",
+        )
     else:
         console.print("\n[dim]Step 1/4: Static Quality Check (skipped)[/dim]")
 
@@ -202,9 +268,7 @@ def _run_analysis(
     console.print(f"\n[bold blue]Step 3/4: Running {args.n_trials} Agent Trials[/bold blue]")
     job_dir, trial_outcomes = _run_agent_trials(args, task_id, dataset_path, console)
 
-    successes = sum(1 for t in trial_outcomes if t.reward == 1)
-    failures = sum(1 for t in trial_outcomes if t.reward is not None and t.reward != 1)
-    errors = sum(1 for t in trial_outcomes if t.exception_type is not None)
+    successes, failures, errors = _tally_outcomes(trial_outcomes)
     success_rate = successes / len(trial_outcomes) if trial_outcomes else 0.0
 
     console.print(f"  Results: {successes} passed, {failures} failed, {errors} errors")
@@ -290,12 +354,88 @@ def _run_analysis(
     )
 
 
+def _task_digest(task_path: Path) -> str:
+    """Content hash of a task directory (relative paths + file bytes, .git skipped)."""
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(task_path):
+        dirs[:] = sorted(d for d in dirs if d != ".git")
+        for name in sorted(files):
+            path = Path(root, name)
+            digest.update(path.relative_to(task_path).as_posix().encode() + b"\0")
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _run_streaming(
+    cmd: list[str], on_line: Callable[[str], None] | None = None
+) -> subprocess.CompletedProcess[str]:
+    """Run cmd with stderr merged into stdout, handing each line to on_line as it arrives."""
+    lines: list[str] = []
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+    ) as proc:
+        for line in proc.stdout:
+            lines.append(line)
+            if on_line is not None:
+                on_line(line)
+    return subprocess.CompletedProcess(cmd, proc.returncode, "".join(lines), "")
+
+
+def _cached_subprocess(
+    cmd: list[str],
+    task_path: Path,
+    cache_dir: Path | None,
+    on_line: Callable[[str], None] | None = None,
+) -> tuple[subprocess.CompletedProcess[str], bool]:
+    """_run_streaming() memoized on the command and the task directory contents.
+
+    Only completed checks (output contains Harbor's result table) are cached, so
+    transient failures are retried next time.
+
+    Returns:
+        Tuple of (completed process, whether it came from the cache)
+    """
+    cache_file = None
+    if cache_dir is not None:
+        key = hashlib.sha256(
+            json.dumps(cmd).encode() + b"\0" + _task_digest(task_path).encode()
+        ).hexdigest()
+        cache_file = cache_dir / f"{key}.json"
+        try:
+            entry = json.loads(cache_file.read_bytes())
+            return (
+                subprocess.CompletedProcess(
+                    cmd, entry["returncode"], entry["stdout"], entry["stderr"]
+                ),
+                True,
+            )
+        except (OSError, ValueError, KeyError):
+            pass
+
+    proc = _run_streaming(cmd, on_line)
+
+    if cache_file is not None and "│" in proc.stdout + proc.stderr:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps(
+                {"returncode": proc.returncode, "stdout": proc.stdout, "stderr": proc.stderr}
+            )
+        )
+        os.replace(tmp, cache_file)
+    return proc, False
+
+
 def _run_quality_check(
     task_path: Path,
     model: str,
     console: Console,
+    cache_dir: Path | None = None,
 ) -> QualityCheckResult:
-    """Run Harbor's static quality check on the task."""
+    """Run Harbor's static quality check on the task.
+
+    With cache_dir, the result is reused while the task files and model are unchanged.
+    """
     cmd = harbor_cmd_base() + [
         "tasks",
         "check",
@@ -304,8 +444,15 @@ def _run_quality_check(
         model,
     ]
 
-    with console.status("[cyan]Running quality check..."):
-        proc = subprocess.run(cmd, capture_output=True, text=True)
+    with console.status("[cyan]Running quality check...") as status:
+
+        def show_line(line: str) -> None:
+            if line.strip():
+                status.update(f"[cyan]Running quality check...[/cyan] [dim]{escape(line.strip()[:80])}")
+
+        proc, cached = _cached_subprocess(cmd, task_path, cache_dir, show_line)
+    if cached:
+        console.print("  [dim]Using cached quality check (task unchanged)[/dim]")
 
     # Parse output to extract issues
     issues = []
@@ -313,16 +460,13 @@ def _run_quality_check(
 
     output = proc.stdout + proc.stderr
 
-    # Look for failed checks in output
-    fail_keywords = ["fail", "FAIL", "❌"]
-    for line in output.split("\n"):
-        for keyword in fail_keywords:
-            if keyword in line and "passed" not in line.lower():
-                clean_line = line.strip()
-                if clean_line and "│" in clean_line:
-                    parts = [p.strip() for p in clean_line.split("│")]
-                    if len(parts) >= 2 and any(k in parts[1].lower() for k in ["fail"]):
-                        issues.append(parts[0])
+    # Look for failed checks in output (rows of Harbor's result table)
+    for line in output.splitlines():
+        if "│" not in line or not _FAIL_LINE_RE.search(line) or _PASSED_RE.search(line):
+            continue
+        parts = [p.strip() for p in line.strip().split("│")]
+        if len(parts) >= 2 and "fail" in parts[1].lower():
+            issues.append(parts[0])
 
     passed = proc.returncode == 0 and len(issues) == 0
 
@@ -449,17 +593,36 @@ def _run_agent_trials(
     ) as progress:
         concurrent_msg = f" ({args.n_concurrent} concurrent)" if args.n_concurrent > 1 else ""
         task = progress.add_task(
-            f"[cyan]Running {args.n_trials} trials with {args.agent}{concurrent_msg}...", total=None
+            f"[cyan]Running {args.n_trials} trials with {args.agent}{concurrent_msg}...",
+            total=args.n_trials,
         )
 
-        _proc = subprocess.run(cmd, capture_output=True, text=True)
-        progress.update(task, completed=True)
+        # Each finished trial writes <job>/<trial>/result.json; poll for those so the
+        # bar advances as concurrent trials complete.
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            while proc.poll() is None:
+                time.sleep(1)
+                done = sum(1 for _ in unique_parent.glob("*/*/result.json"))
+                progress.update(task, completed=min(done, args.n_trials))
+        except BaseException:
+            # Ctrl-C or a polling error: don't leave the Harbor run orphaned
+            proc.kill()
+            proc.wait()
+            raise
+        progress.update(task, completed=args.n_trials)
 
     # Find the job directory that was created inside unique_parent
-    after = set(unique_parent.iterdir()) if unique_parent.exists() else set()
-    new_dirs = [p for p in (after - before) if p.is_dir()]
-    job_dirs = sorted(new_dirs, key=lambda p: p.stat().st_mtime, reverse=True)
-    job_dir = job_dirs[0] if job_dirs else None
+    # scandir's DirEntry answers is_dir() from readdir and caches its stat()
+    job_dirs: list[tuple[float, Path]] = []
+    if unique_parent.exists():
+        with os.scandir(unique_parent) as it:
+            job_dirs = [
+                (entry.stat().st_mtime, Path(entry.path))
+                for entry in it
+                if entry.is_dir(follow_symlinks=False) and Path(entry.path) not in before
+            ]
+    job_dir = max(job_dirs)[1] if job_dirs else None
 
     # Parse trial results
     trial_outcomes = []
@@ -469,45 +632,51 @@ def _run_agent_trials(
     return job_dir, trial_outcomes
 
 
-def _parse_trial_results(job_dir: Path) -> list[TrialOutcome]:
-    """Parse trial results from a job directory."""
-    outcomes = []
+def _parse_trial_result(trial_dir: Path) -> TrialOutcome | None:
+    """Parse one trial directory's result.json (None if missing or unreadable)."""
+    result_path = trial_dir / "result.json"
+    try:
+        # Bytes straight into pydantic: no separate exists() stat, no str decode
+        raw = result_path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+    try:
+        result = _SlimTrialResult.model_validate_json(raw)
+
+        reward = None
+        if result.verifier_result and result.verifier_result.rewards:
+            reward = result.verifier_result.rewards.get("reward")
+
+        exception_type = None
+        exception_message = None
+        if result.exception_info:
+            exception_type = result.exception_info.exception_type
+            exception_message = result.exception_info.exception_message
+
+        return TrialOutcome(
+            trial_name=result.trial_name,
+            trial_dir=trial_dir,
+            reward=reward,
+            exception_type=exception_type,
+            exception_message=exception_message,
+        )
+    except Exception as e:
+        console = Console()
+        console.print(f"[dim]Warning: Could not parse {result_path}: {e}[/dim]")
+        return None
 
-    for trial_dir in job_dir.iterdir():
-        if not trial_dir.is_dir():
-            continue
 
-        result_path = trial_dir / "result.json"
-        if not result_path.exists():
-            continue
-
-        try:
-            result = TrialResult.model_validate_json(result_path.read_text())
-
-            reward = None
-            if result.verifier_result and result.verifier_result.rewards:
-                reward = result.verifier_result.rewards.get("reward")
-
-            exception_type = None
-            exception_message = None
-            if result.exception_info:
-                exception_type = result.exception_info.exception_type
-                exception_message = result.exception_info.exception_message
-
-            outcomes.append(
-                TrialOutcome(
-                    trial_name=result.trial_name,
-                    trial_dir=trial_dir,
-                    reward=reward,
-                    exception_type=exception_type,
-                    exception_message=exception_message,
-                )
-            )
-        except Exception as e:
-            console = Console()
-            console.print(f"[dim]Warning: Could not parse {result_path}: {e}[/dim]")
+def _parse_trial_results(job_dir: Path) -> list[TrialOutcome]:
+    """Parse trial results from a job directory."""
+    with os.scandir(job_dir) as it:
+        trial_dirs = [Path(entry.path) for entry in it if entry.is_dir()]
+    if not trial_dirs:
+        return []
 
-    return outcomes
+    # I/O bound (stat + read per trial), so overlap the reads across threads
+    with ThreadPoolExecutor(max_workers=min(32, len(trial_dirs))) as executor:
+        return [o for o in executor.map(_parse_trial_result, trial_dirs) if o is not None]
 
 
 def _print_report(result: AnalysisResult, console: Console) -> None:
@@ -583,9 +752,7 @@ def _print_report(result: AnalysisResult, console: Console) -> None:
         trials_style = "red"
         trials_icon = "❌"
 
-    successes = sum(1 for t in result.trial_outcomes if t.reward == 1)
-    failures = sum(1 for t in result.trial_outcomes if t.reward is not None and t.reward != 1)
-    errors = sum(1 for t in result.trial_outcomes if t.exception_type)
+    successes, failures, errors = _tally_outcomes(result.trial_outcomes)
 
     table.add_row(
         f"Agent Trials ({result.trials_run})",
@@ -619,21 +786,7 @@ def _print_report(result: AnalysisResult, console: Console) -> None:
         
         for c in result.classifications:
             # Color based on classification
-            if c.classification == Classification.GOOD_SUCCESS:
-                icon = "✅"
-                style = "green"
-            elif c.classification == Classification.GOOD_FAILURE:
-                icon = "⚪"
-                style = "dim"
-            elif c.classification == Classification.BAD_SUCCESS:
-                icon = "🔴"
-                style = "red"
-            elif c.classification == Classification.BAD_FAILURE:
-                icon = "🟡"
-                style = "yellow"
-            else:
-                icon = "⚫"
-                style = "dim"
+            icon, style = _CLASSIFICATION_STYLES.get(c.classification, ("⚫", "dim"))
             
             console.print(f"\n  [{style}]{icon} {c.trial_name}: {c.classification.value} - {c.subtype}[/{style}]")
             console.print(f"     [dim]Evidence:[/dim] {c.evidence}")
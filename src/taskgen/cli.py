@@ -1,29 +1,169 @@
-from __future__ import annotations
-
+import copy
+import functools
+import os
+import stat
+import sys
 from importlib.metadata import PackageNotFoundError as _PkgNotFound
 from importlib.metadata import version as _pkg_version
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
-import json
-from dotenv import load_dotenv
-from harbor.models.environment_type import EnvironmentType
-from rich.console import Console
-
-from taskgen.config import CreateConfig, FarmConfig
-from taskgen.create import MissingIssueError, TrivialPRError
-from taskgen.create.create import run_reversal
-from taskgen.farm import StreamFarmer
-from taskgen.analyze import AnalyzeArgs, run_analyze, TrialClassifier, write_trial_analysis_files
-from taskgen.tools.clean import run_clean
-from taskgen.tools.validate import ValidateArgs, run_validate
-from taskgen.tools.validate_utils import ValidationError
-
-load_dotenv()
+
+if TYPE_CHECKING:
+    from harbor.models.environment_type import EnvironmentType
+    from rich.console import Console
+
+    from taskgen.analyze.models import TrialClassification
+
+# Subcommand implementations (and harbor/rich/dotenv) are imported inside the
+# command callbacks so that `taskgen --help` / `--version` stay cheap.
+
+_SUBCOMMANDS = ("create", "clean", "validate", "analyze", "farm")
+
+# Path option defaults, built once and shared by every command that uses them.
+_P_STATE = Path(".state")
+_P_TASKS = Path("tasks")
+_P_JOBS = Path(".state/harbor-jobs")
+_P_ANALYZE_JOBS = Path(".state/analyze-jobs")
+
+
+def _sniff_subcommand(argv: list[str] | None = None) -> str | None:
+    """Return the subcommand named on the command line, or None.
+
+    The root app only has flag options, so the first non-flag token is the
+    subcommand. Unknown tokens return None so every command gets registered and
+    Click reports the error (or renders the full root help) as usual.
+    """
+    for arg in sys.argv[1:] if argv is None else argv:
+        if not arg.startswith("-"):
+            return arg if arg in _SUBCOMMANDS else None
+    return None
+
+
+@functools.cache
+def _version() -> str:
+    """Installed taskgen version (metadata lookup walks sys.path, so do it once)."""
+    try:
+        return _pkg_version("taskgen")
+    except _PkgNotFound:
+        return "(version unknown)"
+
+
+@functools.cache
+def _env_members() -> dict[str, "EnvironmentType"]:
+    """Accepted --env values (lowercased) mapped to EnvironmentType, built once."""
+    from harbor.models.environment_type import EnvironmentType
+
+    return {e.value.lower(): e for e in EnvironmentType}
+
+
+def _parse_env(value: "str | EnvironmentType") -> "EnvironmentType":
+    """--env parser: converts to harbor's EnvironmentType at parse time.
+
+    harbor is only imported when a value is actually converted, so building the
+    parser (and rendering --help) stays cheap. Raising typer's BadParameter (not a
+    custom click.ParamType) keeps bad values a usage error even when typer ships
+    its own copy of click.
+    """
+    if not isinstance(value, str):
+        return value  # already an EnvironmentType
+    try:
+        return _env_members()[value.lower()]
+    except KeyError:
+        raise typer.BadParameter(
+            f"{value!r} is not one of {', '.join(sorted(_env_members()))}"
+        ) from None
+
+
+# Options shared verbatim by several commands. Typer only reads ParameterInfo, so
+# one instance can serve as the default in every signature that uses it.
+_ENV_OPTION: Any = typer.Option(
+    "docker",
+    "-e",
+    "--env",
+    parser=_parse_env,
+    metavar="ENV",
+    help="Environment type for Harbor runs (docker|daytona|e2b|modal|runloop|gke)",
+    show_default=True,
+)
+_VERBOSE_OPTION: Any = typer.Option(False, "-v", "--verbose", help="Increase output verbosity")
+_QUIET_OPTION: Any = typer.Option(False, "-q", "--quiet", help="Reduce output verbosity")
+_NETWORK_ISOLATED_OPTION: Any = typer.Option(
+    False,
+    "--network-isolated",
+    help="Also run network-isolated validation (nop-no-network, oracle-no-network)",
+)
+
+
+@functools.cache
+def _console() -> "Console":
+    """Process-wide rich Console (terminal detection runs once)."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _print_error(message: str, quiet: bool) -> None:
+    """Report an error; quiet mode writes plain text to stderr and skips rich."""
+    if quiet:
+        sys.stderr.write(f"Error: {message}\n")
+    else:
+        _console().print(f"[red]Error: {message}[/red]")
+
+
+def _emit_json(obj: dict) -> None:
+    """Write `obj` to stdout as a single compact JSON line.
+
+    Uses orjson when it is installed (encodes straight to bytes); falls back to
+    the stdlib encoder otherwise.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        print(json.dumps(obj, separators=(",", ":")))
+        return
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(obj) + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def _absolute(path: Path) -> Path:
+    """Make `path` absolute, skipping resolve()'s realpath walk when it already is."""
+    return path if path.is_absolute() else path.resolve()
+
+
+def _is_dir(path: Path) -> bool:
+    """Existence and directory check with a single stat() call."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode)
+
 
 app = typer.Typer(no_args_is_help=True, add_completion=False, help="Task generation CLI")
 
 
+def main() -> None:
+    """Console entry point: build the Click parser only for the subcommand being run.
+
+    Every command is registered on `app` at import (cheap), but Typer converts all
+    of them to Click commands when the app is invoked. Sniffing argv here rather
+    than at import keeps `import taskgen.cli` independent of the host's argv.
+    """
+    sniffed = _sniff_subcommand()
+    if sniffed is None:
+        app()
+        return
+    slim = copy.copy(app)
+    slim.registered_commands = [c for c in app.registered_commands if c.name == sniffed]
+    slim.registered_groups = [g for g in app.registered_groups if g.name == sniffed]
+    slim()
+
+
 @app.callback(invoke_without_command=True)
 def _root(
     version: bool = typer.Option(
@@ -35,12 +175,13 @@ def _root(
     ),
 ) -> None:
     if version:
-        try:
-            typer.echo(f"taskgen {_pkg_version('taskgen')}")
-        except _PkgNotFound:
-            typer.echo("taskgen (version unknown)")
+        typer.echo(f"taskgen {_version()}")
         raise typer.Exit()
 
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
 
 create_app = typer.Typer(
     no_args_is_help=True,
@@ -54,21 +195,17 @@ create_app = typer.Typer(
 def create_cmd(
     repo: str = typer.Option(..., help="GitHub repository (owner/repo or URL)"),
     pr: int = typer.Option(..., help="PR number"),
-    output: Path = typer.Option(Path("tasks"), help="Output root", show_default=True),
+    output: Path = typer.Option(_P_TASKS, help="Output root", show_default=True),
     cc_timeout: int = typer.Option(
         3200, help="Timeout for CC session in seconds (~53 min default)", show_default=True
     ),
     validate: bool = typer.Option(
         True, help="Run Harbor validations; --no-validate skips validation"
     ),
-    network_isolated: bool = typer.Option(
-        False,
-        "--network-isolated",
-        help="Also run network-isolated validation (nop-no-network, oracle-no-network)",
-    ),
+    network_isolated: bool = _NETWORK_ISOLATED_OPTION,
     force: bool = typer.Option(False, help="Bypass local dedupe and regenerate"),
     state_dir: Path = typer.Option(
-        Path(".state"), help="Local dedupe state dir", show_default=True
+        _P_STATE, help="Local dedupe state dir", show_default=True
     ),
     no_cache: bool = typer.Option(
         False, "--no-cache", help="Disable reusing cached Dockerfiles/test.sh from previous tasks"
@@ -89,16 +226,15 @@ def create_cmd(
         True,
         help="Require PR to have a linked issue (higher quality instructions); --no-require-issue uses PR body/title instead",
     ),
-    environment: str = typer.Option(
-        "docker",
-        "-e",
-        "--env",
-        help="Environment type for Harbor runs (docker|daytona|e2b|modal|runloop|gke)",
-        show_default=True,
-    ),
-    verbose: bool = typer.Option(False, "-v", "--verbose", help="Increase output verbosity"),
-    quiet: bool = typer.Option(False, "-q", "--quiet", help="Reduce output verbosity"),
+    environment: Any = _ENV_OPTION,
+    verbose: bool = _VERBOSE_OPTION,
+    quiet: bool = _QUIET_OPTION,
 ) -> None:
+    from taskgen.config import CreateConfig
+    from taskgen.create import MissingIssueError, TrivialPRError
+    from taskgen.create.create import run_reversal
+    from taskgen.tools.validate_utils import ValidationError
+
     config = CreateConfig(
         repo=repo,
         pr=pr,
@@ -113,7 +249,7 @@ def create_cmd(
         min_source_files=min_source_files,
         max_source_files=max_source_files,
         require_issue=require_issue,
-        environment=EnvironmentType(environment),
+        environment=environment,
         verbose=verbose,
         quiet=quiet,
     )
@@ -129,17 +265,20 @@ app.add_typer(create_app, name="create")
 
 
 @app.command(
-    help="Remove local artifacts: .state/* runs/jobs/logs; options for ledgers/cache/tasks"
+    name="clean",
+    help="Remove local artifacts: .state/* runs/jobs/logs; options for ledgers/cache/tasks",
 )
 def clean(
-    state_dir: Path = typer.Option(Path(".state"), help="State dir to clean", show_default=True),
-    output: Path = typer.Option(Path("tasks"), help="Tasks output root", show_default=True),
+    state_dir: Path = typer.Option(_P_STATE, help="State dir to clean", show_default=True),
+    output: Path = typer.Option(_P_TASKS, help="Tasks output root", show_default=True),
     all: bool = typer.Option(False, "--all", help="Also remove ledgers, cache, and tasks outputs"),
     ledgers: bool = typer.Option(False, help="Also remove .state/create.jsonl"),
     cache: bool = typer.Option(False, help="Also remove .state/cache"),
     tasks: bool = typer.Option(False, help="Also remove tasks/"),
     dry_run: bool = typer.Option(False, help="Print what would be removed without deleting"),
 ) -> None:
+    from taskgen.tools.clean import run_clean
+
     run_clean(
         state_dir=state_dir,
         output_root=output,
@@ -151,7 +290,7 @@ def clean(
     )
 
 
-@app.command(help="Validate an existing Harbor task by running NOP and ORACLE")
+@app.command(name="validate", help="Validate an existing Harbor task by running NOP and ORACLE")
 def validate(
     path: Path = typer.Argument(
         ...,
@@ -161,26 +300,16 @@ def validate(
     | None = typer.Option(None, "--task", "-t", help="Task ID when --path points to dataset root"),
     agent: str = typer.Option("both", help="Agent to run: both|nop|oracle", show_default=True),
     jobs_dir: Path = typer.Option(
-        Path(".state/harbor-jobs"),
+        _P_JOBS,
         help="Directory to store Harbor job artifacts",
         show_default=True,
     ),
     timeout_multiplier: float
     | None = typer.Option(None, help="Multiply default timeouts (e.g., 3.0)"),
-    network_isolated: bool = typer.Option(
-        False,
-        "--network-isolated",
-        help="Also run network-isolated validation (nop-no-network, oracle-no-network)",
-    ),
-    environment: str = typer.Option(
-        "docker",
-        "-e",
-        "--env",
-        help="Environment type for Harbor runs (docker|daytona|e2b|modal|runloop|gke)",
-        show_default=True,
-    ),
-    verbose: bool = typer.Option(False, "-v", "--verbose", help="Increase output verbosity"),
-    quiet: bool = typer.Option(False, "-q", "--quiet", help="Reduce output verbosity"),
+    network_isolated: bool = _NETWORK_ISOLATED_OPTION,
+    environment: Any = _ENV_OPTION,
+    verbose: bool = _VERBOSE_OPTION,
+    quiet: bool = _QUIET_OPTION,
     max_parallel: int = typer.Option(
         8, help="Maximum number of parallel validations (batch mode only)", show_default=True
     ),
@@ -194,8 +323,13 @@ def validate(
         None, "-o", "--output", help="Write results to file as they complete (batch mode only)"
     ),
 ) -> None:
-    if agent not in ("both", "nop", "oracle"):
-        raise typer.BadParameter("agent must be one of: both, nop, oracle")
+    from taskgen.config import VALIDATE_AGENTS
+
+    if agent not in VALIDATE_AGENTS:
+        raise typer.BadParameter(f"agent must be one of: {', '.join(sorted(VALIDATE_AGENTS))}")
+
+    from taskgen.tools.validate import ValidateArgs, run_validate
+
     run_validate(
         ValidateArgs(
             path=path,
@@ -206,7 +340,7 @@ def validate(
             verbose=verbose,
             quiet=quiet,
             network_isolated=network_isolated,
-            environment=EnvironmentType(environment),
+            environment=environment,
             max_parallel=max_parallel,
             show_passed=show_passed,
             output_file=output,
@@ -241,7 +375,7 @@ def analyze_task(
         3, "-n", "--n-concurrent", help="Number of concurrent trials (1=sequential, 3-5 recommended)", show_default=True
     ),
     jobs_dir: Path = typer.Option(
-        Path(".state/analyze-jobs"),
+        _P_ANALYZE_JOBS,
         "--jobs-dir",
         help="Directory to store job artifacts",
         show_default=True,
@@ -264,14 +398,8 @@ def analyze_task(
     timeout_multiplier: float = typer.Option(
         1.0, "--timeout-multiplier", help="Multiply default timeouts", show_default=True
     ),
-    environment: str = typer.Option(
-        "docker",
-        "-e",
-        "--env",
-        help="Environment type for Harbor runs (docker|daytona|e2b|modal|runloop|gke)",
-        show_default=True,
-    ),
-    verbose: bool = typer.Option(False, "-v", "--verbose", help="Increase output verbosity"),
+    environment: Any = _ENV_OPTION,
+    verbose: bool = _VERBOSE_OPTION,
     classification_timeout: int = typer.Option(
         300,
         "--classification-timeout",
@@ -289,6 +417,9 @@ def analyze_task(
         "--save-to-dir",
         help="Write trajectory-analysis.{md,json} to each trial directory",
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Re-run the quality check even if the task is unchanged"
+    ),
 ) -> None:
     """
     Analyze a Harbor task to determine if it's well-specified.
@@ -319,6 +450,8 @@ def analyze_task(
         # Parallel (3 trials at once)
         taskgen analyze task tasks/my-task -k 10 -n 3
     """
+    from taskgen.analyze import AnalyzeArgs, run_analyze
+
     run_analyze(
         AnalyzeArgs(
             task_path=path,
@@ -331,16 +464,41 @@ def analyze_task(
             skip_baseline=skip_baseline,
             skip_classify=skip_classify,
             analysis_model=analysis_model,
-            environment=environment,
+            environment=environment.value,
             timeout_multiplier=timeout_multiplier,
             verbose=verbose,
             classification_timeout=classification_timeout,
             verdict_timeout=verdict_timeout,
             save_to_dir=save_to_dir,
+            no_cache=no_cache,
         )
     )
 
 
+def _render_human(
+    console: "Console", classification: "TrialClassification", trial_path: Path
+) -> None:
+    """Print the human-readable `analyze trial` result (non-quiet mode only)."""
+    classification_str = classification.classification.value
+    if classification.classification.is_task_problem:
+        style = "yellow"
+        icon = "⚠️"
+    elif classification.classification.is_success:
+        style = "green"
+        icon = "✅"
+    else:
+        style = "dim"
+        icon = "⚪"
+
+    console.print(f"\n[{style}]{icon} {classification_str} - {classification.subtype}[/{style}]")
+    console.print(f"  [dim]Evidence:[/dim] {classification.evidence}")
+    console.print(f"  [dim]Root cause:[/dim] {classification.root_cause}")
+    if classification.is_task_problem:
+        console.print(f"  [yellow]Recommendation:[/yellow] {classification.recommendation}")
+
+    console.print(f"\n[dim]Output written to {trial_path}/trajectory-analysis.*[/dim]")
+
+
 @analyze_app.command(name="trial", help="Classify a single completed trial (trajectory analysis)")
 def analyze_trial(
     trial_dir: Path = typer.Argument(..., help="Path to the trial directory (contains result.json, agent/, verifier/)"),
@@ -411,18 +569,18 @@ def analyze_trial(
         # Quiet mode - just output JSON to stdout
         taskgen analyze trial trial_dir -t task_dir -q
     """
-    console = Console()
-    
+    from taskgen.analyze import TrialClassifier, write_trial_analysis_files
+
     # Validate paths
-    trial_path = trial_dir.resolve()
-    task_path = task_dir.resolve()
+    trial_path = _absolute(trial_dir)
+    task_path = _absolute(task_dir)
     
-    if not trial_path.is_dir():
-        console.print(f"[red]Error: Trial directory does not exist: {trial_path}[/red]")
+    if not _is_dir(trial_path):
+        _print_error(f"Trial directory does not exist: {trial_path}", quiet)
         raise typer.Exit(1)
     
-    if not task_path.is_dir():
-        console.print(f"[red]Error: Task directory does not exist: {task_path}[/red]")
+    if not _is_dir(task_path):
+        _print_error(f"Task directory does not exist: {task_path}", quiet)
         raise typer.Exit(1)
     
     # Default task_id to directory name
@@ -430,6 +588,7 @@ def analyze_trial(
         task_id = task_path.name
     
     if not quiet:
+        console = _console()
         console.print(f"[bold]Classifying trial:[/bold] {trial_path.name}")
         console.print(f"  Task: {task_id}")
         console.print(f"  Agent: {agent}")
@@ -445,7 +604,7 @@ def analyze_trial(
     classification = classifier.classify_trial_sync(trial_path, task_path)
     
     # Write output files
-    write_trial_analysis_files(
+    json_data = write_trial_analysis_files(
         trial_dir=trial_path,
         classification=classification,
         task_id=task_id,
@@ -455,53 +614,25 @@ def analyze_trial(
     
     # Output result
     if quiet:
-        # JSON-only output for piping
-        result = {
-            "task_id": task_id,
-            "agent": agent,
-            "model": model,
-            "classification": classification.classification.value,
-            "subtype": classification.subtype,
-            "evidence": classification.evidence,
-            "root_cause": classification.root_cause,
-            "recommendation": classification.recommendation,
-        }
-        print(json.dumps(result))
+        # JSON-only output for piping: one compact line (the file on disk is indented)
+        _emit_json(json_data)
     else:
-        # Human-readable output
-        classification_str = classification.classification.value
-        if classification.classification.is_task_problem:
-            style = "yellow"
-            icon = "⚠️"
-        elif classification.classification.is_success:
-            style = "green"
-            icon = "✅"
-        else:
-            style = "dim"
-            icon = "⚪"
-        
-        console.print(f"\n[{style}]{icon} {classification_str} - {classification.subtype}[/{style}]")
-        console.print(f"  [dim]Evidence:[/dim] {classification.evidence}")
-        console.print(f"  [dim]Root cause:[/dim] {classification.root_cause}")
-        if classification.is_task_problem:
-            console.print(f"  [yellow]Recommendation:[/yellow] {classification.recommendation}")
-        
-        console.print(f"\n[dim]Output written to {trial_path}/trajectory-analysis.*[/dim]")
+        _render_human(_console(), classification, trial_path)
 
 
 app.add_typer(analyze_app, name="analyze")
 
 
-@app.command(help="Continuous PR farming - stream through entire PR history")
+@app.command(name="farm", help="Continuous PR farming - stream through entire PR history")
 def farm(
     repo: str = typer.Argument(
         ..., help="GitHub repository in owner/name format (e.g., fastapi/fastapi)"
     ),
     output: Path = typer.Option(
-        Path("tasks"), help="Output directory for generated tasks", show_default=True
+        _P_TASKS, help="Output directory for generated tasks", show_default=True
     ),
     state_dir: Path = typer.Option(
-        Path(".state"), help="State directory for cache/logs", show_default=True
+        _P_STATE, help="State directory for cache/logs", show_default=True
     ),
     force: bool = typer.Option(True, help="Regenerate even if task already exists"),
     timeout: int = typer.Option(300, help="Timeout per PR in seconds", show_default=True),
@@ -540,13 +671,7 @@ def farm(
         help="Maximum number of source files to avoid large refactors (tests excluded)",
         show_default=True,
     ),
-    environment: str = typer.Option(
-        "docker",
-        "-e",
-        "--env",
-        help="Environment type for Harbor runs (docker|daytona|e2b|modal|runloop|gke)",
-        show_default=True,
-    ),
+    environment: Any = _ENV_OPTION,
     verbose: bool = typer.Option(False, "-v", "--verbose", help="Enable verbose output"),
     issue_only: bool = typer.Option(
         True,
@@ -556,8 +681,21 @@ def farm(
     validate: bool = typer.Option(
         True, help="Run Harbor validation after CC; --no-validate to skip"
     ),
-    network_isolated: bool = typer.Option(
-        False, "--network-isolated", help="Also run network-isolated validation"
+    network_isolated: bool = _NETWORK_ISOLATED_OPTION,
+    max_parallel: int = typer.Option(
+        1,
+        min=1,
+        help="Maximum number of PRs processed concurrently (1 = sequential)",
+        show_default=True,
+    ),
+    semantic_cache: bool = typer.Option(
+        False,
+        "--semantic-cache",
+        help=(
+            "Skip the LLM for PRs nearly identical to ones already judged trivial. "
+            "Pays off on repos with repetitive bot/dependency-bump PRs; elsewhere it "
+            "adds an embeddings call per PR"
+        ),
     ),
 ) -> None:
     """
@@ -565,6 +703,9 @@ def farm(
     Streams PRs page-by-page, processes them immediately, and maintains state for resumable operation.
     Uses a universal language-agnostic pipeline that works for any repository.
     """
+    from taskgen.config import FarmConfig
+    from taskgen.farm import StreamFarmer
+
     config = FarmConfig(
         repo=repo,
         output=output,
@@ -583,14 +724,15 @@ def farm(
         require_minimum_difficulty=require_minimum_difficulty,
         min_source_files=min_source_files,
         max_source_files=max_source_files,
-        environment=EnvironmentType(environment),
+        environment=environment,
         verbose=verbose,
         issue_only=issue_only,
         validate=validate,
         network_isolated=network_isolated,
+        max_parallel=max_parallel,
+        semantic_cache=semantic_cache,
     )
 
-    console = Console()
-    farmer = StreamFarmer(config.repo, config, console)
+    farmer = StreamFarmer(config.repo, config, _console())
     exit_code = farmer.run()
     raise typer.Exit(code=exit_code)
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Literal, get_args
 
 from harbor.models.environment_type import EnvironmentType
 
+ValidateAgent = Literal["both", "nop", "oracle"]
+VALIDATE_AGENTS: frozenset[str] = frozenset(get_args(ValidateAgent))
 
-@dataclass(frozen=True)
+# Path is immutable, so the defaults can be shared instead of built per instance.
+_DEFAULT_OUTPUT = Path("tasks")
+_DEFAULT_STATE_DIR = Path(".state")
+_DEFAULT_JOBS_DIR = Path(".state/harbor-jobs")
+
+
+@dataclass(frozen=True, slots=True)
 class CreateConfig:
     """Configuration for the create command (PR → Harbor task).
 
@@ -32,16 +40,19 @@ class CreateConfig:
         environment: Environment type for Harbor runs (docker, daytona, e2b, modal, runloop, gke)
         verbose: Increase output verbosity
         quiet: Reduce output verbosity
+        repo_cache_dir: Directory for the local repo clone (default: <state_dir>/repos)
+        semantic_cache: Reuse LLM "trivial" verdicts of near-duplicate PRs
+        live_status: Show rich status spinners (farm disables them for concurrent PRs)
     """
 
     repo: str
     pr: int
-    output: Path = field(default_factory=lambda: Path("tasks"))
+    output: Path = _DEFAULT_OUTPUT
     cc_timeout: int = 3200
     validate: bool = True
     network_isolated: bool = False
     force: bool = False
-    state_dir: Path = field(default_factory=lambda: Path(".state"))
+    state_dir: Path = _DEFAULT_STATE_DIR
     use_cache: bool = True
     require_minimum_difficulty: bool = True
     min_source_files: int = 3
@@ -50,6 +61,9 @@ class CreateConfig:
     environment: EnvironmentType = EnvironmentType.DOCKER
     verbose: bool = False
     quiet: bool = False
+    repo_cache_dir: Path | None = None
+    semantic_cache: bool = False
+    live_status: bool = True
 
     # Computed property for backward compatibility with old code
     @property
@@ -58,7 +72,7 @@ class CreateConfig:
         return not self.validate
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FarmConfig:
     """Configuration for the farm command (continuous PR processing).
 
@@ -89,11 +103,13 @@ class FarmConfig:
         issue_only: Only process PRs that have linked issues (higher quality instructions)
         validate: Run Harbor validation after CC (useful when CC times out but task may be valid)
         network_isolated: Also run network-isolated validation
+        max_parallel: Maximum number of PRs processed concurrently (1 = sequential)
+        semantic_cache: Reuse LLM "trivial" verdicts of near-duplicate PRs
     """
 
     repo: str
-    output: Path = field(default_factory=lambda: Path("tasks"))
-    state_dir: Path = field(default_factory=lambda: Path(".state"))
+    output: Path = _DEFAULT_OUTPUT
+    state_dir: Path = _DEFAULT_STATE_DIR
     force: bool = True
     timeout: int = 300
     cc_timeout: int = 900
@@ -113,9 +129,11 @@ class FarmConfig:
     issue_only: bool = False
     validate: bool = True
     network_isolated: bool = False
+    max_parallel: int = 1
+    semantic_cache: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidateConfig:
     """Configuration for the validate command.
 
@@ -135,8 +153,8 @@ class ValidateConfig:
 
     path: Path
     task: str | None = None
-    agent: Literal["both", "nop", "oracle"] = "both"
-    jobs_dir: Path = field(default_factory=lambda: Path(".state/harbor-jobs"))
+    agent: ValidateAgent = "both"
+    jobs_dir: Path = _DEFAULT_JOBS_DIR
     timeout_multiplier: float | None = None
     network_isolated: bool = False
     environment: EnvironmentType = EnvironmentType.DOCKER
@@ -145,8 +163,12 @@ class ValidateConfig:
     max_parallel: int = 8
     show_passed: bool = False
 
+    def __post_init__(self) -> None:
+        if self.agent not in VALIDATE_AGENTS:
+            raise ValueError(f"agent must be one of: {', '.join(sorted(VALIDATE_AGENTS))}")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CleanConfig:
     """Configuration for the clean command.
 
@@ -160,8 +182,8 @@ class CleanConfig:
         dry_run: Print what would be removed without deleting
     """
 
-    state_dir: Path = field(default_factory=lambda: Path(".state"))
-    output_root: Path = field(default_factory=lambda: Path("tasks"))
+    state_dir: Path = _DEFAULT_STATE_DIR
+    output_root: Path = _DEFAULT_OUTPUT
     all_: bool = False
     ledgers: bool = False
     cache: bool = False
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import time
 import traceback
+from contextlib import AbstractContextManager, nullcontext
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -367,12 +369,18 @@ def _display_next_steps_panel(
     console.print(Panel(steps, title="Next Steps", border_style="cyan"))
 
 
+def _status(console: Console, message: str, live: bool = True) -> AbstractContextManager:
+    """console.status() spinner, or a no-op when live displays are turned off."""
+    return console.status(message, spinner="dots") if live else nullcontext()
+
+
 def _run_harbor_validations(
     task_id: str,
     harbor_root: Path,
     harbor_jobs: Path,
     console: Console,
     environment: EnvironmentType = EnvironmentType.DOCKER,
+    live_status: bool = True,
 ) -> tuple[list[list[str]], dict[str, str | None]]:
     """Run Harbor validations (nop + oracle) sequentially.
 
@@ -381,7 +389,7 @@ def _run_harbor_validations(
         - results_rows: List of [phase, expected, actual, match] for each validation
         - job_dirs: Dict mapping agent names to job directory paths (as strings)
     """
-    with console.status("Running harbor nop + oracle...", spinner="dots"):
+    with _status(console, "Running harbor nop + oracle...", live_status):
         reward_nop, reward_oracle, job_paths = run_nop_oracle(
             task_id=task_id,
             dataset_path=harbor_root,
@@ -427,7 +435,7 @@ def run_reversal(config: CreateConfig) -> None:
     logs_root = Path(config.state_dir) / "logs"
     logs_root.mkdir(parents=True, exist_ok=True)
     gen_log_path = logs_root / f"generate-{pipeline.task_id}.log"
-    _configure_file_logger(gen_log_path)
+    log_handler = _configure_file_logger(gen_log_path)
     try:
         # Header
         _display_header(console, pipeline, config.pr)
@@ -463,7 +471,9 @@ def run_reversal(config: CreateConfig) -> None:
             console.print(
                 "[dim]  → Cloning/updating repo cache (may take a minute for first clone)...[/dim]"
             )
-            repo_cache_dir = config.state_dir / "repos" if config.state_dir else None
+            repo_cache_dir = config.repo_cache_dir or (
+                config.state_dir / "repos" if config.state_dir else None
+            )
             repo_cache = RepoCache(repo_cache_dir)
             repo_path = repo_cache.get_or_clone(
                 repo=pipeline.repo,
@@ -474,7 +484,7 @@ def run_reversal(config: CreateConfig) -> None:
 
             # Step 1c: Generate universal skeleton files (includes LLM call for PR evaluation)
             console.print("[dim]  → Generating skeleton and evaluating...[/dim]")
-            with console.status("Evaluating PR & writing skeleton...", spinner="dots"):
+            with _status(console, "Evaluating PR & writing skeleton...", config.live_status):
                 (
                     task_dir,
                     _,
@@ -496,6 +506,7 @@ def run_reversal(config: CreateConfig) -> None:
                     min_source_files=config.min_source_files,
                     max_source_files=config.max_source_files,
                     environment=config.environment.value,
+                    semantic_cache=config.semantic_cache,
                 )
 
             skeleton_secs = time.perf_counter() - t0
@@ -627,7 +638,7 @@ def run_reversal(config: CreateConfig) -> None:
             console.print(Rule(Text("Validations", style="bold blue")))
 
             validation_results, job_dirs = _run_harbor_validations(
-                task_id, harbor_root, harbor_jobs, console, config.environment
+                task_id, harbor_root, harbor_jobs, console, config.environment, config.live_status
             )
             results_rows.extend(validation_results)
             harbor_nop_job_dir = job_dirs.get("nop")
@@ -648,6 +659,7 @@ def run_reversal(config: CreateConfig) -> None:
                     console,
                     "nop",
                     environment=config.environment,
+                    live_status=config.live_status,
                 )
                 harbor_oracle_no_net_job = _run_harbor_with_status(
                     task_id,
@@ -656,6 +668,7 @@ def run_reversal(config: CreateConfig) -> None:
                     console,
                     "oracle",
                     environment=config.environment,
+                    live_status=config.live_status,
                 )
 
             reward_nop_no_net = parse_harbor_outcome(harbor_nop_no_net_job).reward
@@ -726,6 +739,8 @@ def run_reversal(config: CreateConfig) -> None:
         console.print(Panel(Text(str(e)), title="Error", border_style="red"))
         traceback.print_exc()
         raise
+    finally:
+        _remove_file_logger(log_handler)
 
 
 def _run_harbor_with_status(
@@ -736,6 +751,7 @@ def _run_harbor_with_status(
     phase: str,
     delete_after: bool = True,
     environment: EnvironmentType = EnvironmentType.DOCKER,
+    live_status: bool = True,
 ) -> Path | None:
     """Run harbor with a rich console status spinner.
 
@@ -749,8 +765,9 @@ def _run_harbor_with_status(
         phase: Agent name ("nop" or "oracle")
         delete_after: If True, delete Docker image after run (default: True)
         environment: Environment type (docker, daytona, e2b, modal, runloop, gke)
+        live_status: Show the spinner (False when several PRs run concurrently)
     """
-    with console.status(f"Running harbor {phase}...", spinner="dots"):
+    with _status(console, f"Running harbor {phase}...", live_status):
         _, job_result = run_harbor_agent(
             task_id=task_id,
             dataset_path=harbor_root,
@@ -763,14 +780,26 @@ def _run_harbor_with_status(
     return job_result
 
 
-def _configure_file_logger(path: Path) -> None:
+def _configure_file_logger(path: Path) -> logging.Handler:
+    """Attach a generation-log handler for the PR being processed on this thread.
+
+    Farm runs several PRs at once on worker threads, all logging through the shared
+    "taskgen" logger, so each handler only accepts records from the thread that
+    attached it. Detach it with _remove_file_logger when the PR is done.
+    """
     logger = logging.getLogger("taskgen")
     logger.setLevel(logging.DEBUG)
     logger.propagate = False
-    # Clear existing handlers
-    logger.handlers = []
     fh = logging.FileHandler(path)
     fh.setLevel(logging.DEBUG)
     fmt = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
     fh.setFormatter(fmt)
+    thread_id = threading.get_ident()
+    fh.addFilter(lambda record: record.thread == thread_id)
     logger.addHandler(fh)
+    return fh
+
+
+def _remove_file_logger(handler: logging.Handler) -> None:
+    logging.getLogger("taskgen").removeHandler(handler)
+    handler.close()
@@ -98,6 +98,7 @@ class PRToHarborPipeline:
         min_source_files: int = 3,
         max_source_files: int = 10,
         environment: str = "docker",
+        semantic_cache: bool = False,
     ) -> tuple[Path, MakeItWorkResult | None, list[str], TaskReference | None]:
         """
         Generate a Harbor task for ANY language using a universal skeleton + Claude Code.
@@ -123,10 +124,12 @@ class PRToHarborPipeline:
             cc_timeout: Timeout for CC session in seconds
             verbose: If True, stream CC output
             use_cache: If True, try to reuse cached artifacts from previous successful PRs
-            state_dir: State directory for task references (default: .state)
+            state_dir: State directory for task references and the PR evaluation cache
+                (default: .state)
             require_minimum_difficulty: If True, require 3+ source files modified
             min_source_files: Minimum number of source files required (default: 3)
             max_source_files: Maximum number of source files allowed to avoid large refactors (default: 10)
+            semantic_cache: Reuse LLM "trivial" verdicts of near-duplicate PRs
 
         Returns:
             Tuple of (task_dir, cc_result, extracted_test_files, task_reference)
@@ -239,6 +242,8 @@ class PRToHarborPipeline:
                     self.repo,
                     linked_issues=linked_issues,
                     force_generate_instruction=(not require_minimum_difficulty),
+                    cache_dir=(state_dir / "cache" / "pr_evaluations") if state_dir else None,
+                    semantic_cache=semantic_cache,
                 )
 
                 if not combined_result.is_substantial:
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import operator
+import sqlite3
+from array import array
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .utils import CombinedPRTaskEvaluation
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+logger = logging.getLogger("taskgen")
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+SIMILARITY_THRESHOLD = 0.92
+MAX_EMBEDDED_BODY_LENGTH = 512
+# A lookup compares against at most this many of the repo's newest trivial verdicts
+MAX_SCAN_ROWS = 500
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        key TEXT PRIMARY KEY,
+        repo TEXT NOT NULL,
+        embedding BLOB NOT NULL,
+        norm REAL NOT NULL,
+        result TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS entries_repo ON entries (repo)",
+    # Older versions stored every looked-up PR; rows without a verdict never hit
+    "DELETE FROM entries WHERE result IS NULL",
+)
+
+
+def _cosine(a: array, b: array, norm_a: float, norm_b: float) -> float:
+    if not norm_a or not norm_b:
+        return 0.0
+    return sum(map(operator.mul, a, b)) / (norm_a * norm_b)
+
+
+class SemanticEvaluationCache:
+    """Reuses "not substantial" evaluations for near-duplicate PRs.
+
+    Dependency bumps, typo fixes and bot churn produce many PRs whose title/body
+    are nearly identical. A PR judged trivial has its title + body prefix embedded
+    and stored (in a local SQLite file) with the verdict; a later PR of the same repo
+    whose embedding is close enough reuses that verdict instead of calling the LLM.
+    Substantial verdicts are never stored: their instruction is PR-specific.
+
+    This pays off for repos with lots of repetitive trivial PRs (bots, dependency
+    bumps): a hit costs one embeddings call instead of a chat completion. On repos
+    without that churn it mostly adds an embeddings call per PR, so it is opt-in;
+    lookups are skipped outright while a repo has no stored verdicts.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        client: OpenAI,
+        threshold: float = SIMILARITY_THRESHOLD,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            db_path: SQLite file holding embeddings and cached verdicts
+            client: OpenAI client used for embeddings
+            threshold: Minimum cosine similarity for a cache hit
+        """
+        self.db_path = db_path
+        self.client = client
+        self.threshold = threshold
+        # Embeddings computed by lookup(), reused by store() for the same PR text
+        self._embedded: dict[str, tuple[array, float]] = {}
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    @staticmethod
+    def _key(repo: str, text: str) -> str:
+        return hashlib.sha256(f"{repo}\0{text}".encode()).hexdigest()
+
+    @staticmethod
+    def text_for(pr_title: str, pr_body: str) -> str:
+        """The PR text that gets embedded (title plus the start of the body)."""
+        return f"{pr_title}\n{(pr_body or '')[:MAX_EMBEDDED_BODY_LENGTH]}".strip()
+
+    def _embedding(self, key: str, text: str) -> tuple[array, float]:
+        if key not in self._embedded:
+            response = self.client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+            vector = array("f", response.data[0].embedding)
+            self._embedded[key] = vector, math.sqrt(math.fsum(x * x for x in vector))
+        return self._embedded[key]
+
+    def lookup(self, repo: str, text: str) -> CombinedPRTaskEvaluation | None:
+        """Return a cached trivial verdict for a near-duplicate PR, if any.
+
+        Args:
+            repo: Repository in "owner/repo" format
+            text: PR text from text_for()
+
+        Returns:
+            The reused evaluation, or None on a miss
+        """
+        key = self._key(repo, text)
+        with closing(self._connect()) as conn:
+            exact = conn.execute("SELECT result FROM entries WHERE key = ?", (key,)).fetchone()
+            if exact is not None:
+                logger.info("Semantic cache hit (identical PR text); reusing trivial verdict")
+                return CombinedPRTaskEvaluation.model_validate_json(exact[0])
+            rows = conn.execute(
+                "SELECT embedding, norm, result FROM entries WHERE repo = ? "
+                "ORDER BY rowid DESC LIMIT ?",
+                (repo, MAX_SCAN_ROWS),
+            ).fetchall()
+        if not rows:
+            return None  # Nothing to compare against: skip the embeddings call
+
+        vector, norm = self._embedding(key, text)
+        best_score, best_result = 0.0, None
+        for blob, other_norm, result in rows:
+            other = array("f")
+            other.frombytes(blob)
+            score = _cosine(vector, other, norm, other_norm)
+            if score > best_score:
+                best_score, best_result = score, result
+
+        if best_result is None or best_score < self.threshold:
+            return None
+        logger.info(f"Semantic cache hit (similarity {best_score:.3f}); reusing trivial verdict")
+        return CombinedPRTaskEvaluation.model_validate_json(best_result)
+
+    def store(self, repo: str, text: str, result: CombinedPRTaskEvaluation) -> None:
+        """Remember a trivial verdict so near-duplicate PRs can reuse it.
+
+        Args:
+            repo: Repository in "owner/repo" format
+            text: PR text from text_for()
+            result: The evaluation (ignored unless is_substantial is False)
+        """
+        if result.is_substantial:
+            return
+        key = self._key(repo, text)
+        vector, norm = self._embedding(key, text)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, repo, embedding, norm, result) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, repo, vector.tobytes(), norm, result.model_dump_json()),
+            )
@@ -1,19 +1,34 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
 import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from openai import OpenAI
-
+from .semantic_cache import SemanticEvaluationCache
 from .utils import CombinedPRTaskEvaluation
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 MAX_LINKED_ISSUES = 5
+# Body limits are UTF-8 bytes, a cheap token proxy: ~4 bytes/token for ASCII text,
+# and CJK/emoji (3-4 bytes, about a token each) no longer blow past the budget.
 MAX_ISSUE_BODY_LENGTH = 2500
 MAX_PR_BODY_LENGTH = 2500
 MIN_INSTRUCTION_LENGTH = 100
 OPENAI_API_TIMEOUT = 90.0
 MAX_COMPLETION_TOKENS = 4096
 DEBUG_REASON_TRUNCATE_LENGTH = 100
+# Routes requests sharing the static prompt prefix to the same provider cache.
+PROMPT_CACHE_KEY = "taskgen-combined-v1"
+# Rough path classifiers for the "Scope" line of the prompt
+_TEST_PATH_RE = re.compile("test", re.I)
+_DOC_PATH_RE = re.compile("docs?/", re.I)
 
 COMBINED_SYSTEM_PROMPT = """You are evaluating GitHub pull requests and converting substantial ones into Harbor tasks.
 
@@ -86,7 +101,16 @@ Examples:
 IMPORTANT: Generate exactly 3 tags.
 
 If NOT substantial, set instruction to null and provide a brief reason.
-"""
+""".strip()
+
+
+def _truncate_utf8(text: str, max_bytes: int) -> str:
+    """Cut text to at most max_bytes of UTF-8, marking it when truncated."""
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text
+    # "ignore" drops a multi-byte character split by the cut
+    return encoded[:max_bytes].decode("utf-8", "ignore") + "\n...(truncated)"
 
 
 def _format_user_prompt(
@@ -100,29 +124,32 @@ def _format_user_prompt(
     """Format user prompt for combined evaluation + task generation.
 
     Prioritizes linked issues and avoids leaking solution details (files, diff, commits).
+    The fixed instruction text comes first and the PR-specific data last, so the
+    system prompt plus the start of the user message form a byte-stable prefix
+    that the provider can serve from its prompt cache.
     """
     # Calculate basic stats for evaluation (no file names - just counts)
-    total = len(changed_files or [])
-    tests = sum(1 for p in (changed_files or []) if "test" in (p or "").lower())
-    docs = sum(
-        1
-        for p in (changed_files or [])
-        if any(seg in (p or "").lower() for seg in ("docs/", "doc/"))
-    )
+    total = tests = docs = 0
+    for p in changed_files or []:
+        total += 1
+        if not p:
+            continue
+        tests += _TEST_PATH_RE.search(p) is not None
+        docs += _DOC_PATH_RE.search(p) is not None
     source_files = total - tests - docs
 
-    # Modify ending instruction based on force_generate_instruction flag
+    # Modify the instruction block based on force_generate_instruction flag
     if force_generate_instruction:
-        ending_instruction = (
-            "\nIMPORTANT: Generate a detailed instruction for this PR regardless of complexity.\n"
+        instruction_block = (
+            "IMPORTANT: Generate a detailed instruction for this PR regardless of complexity.\n"
             "You should ALWAYS set is_substantial=true and write a comprehensive bug report/task instruction.\n"
             "Even if the PR seems simple, treat it as a valid task and describe the problem that was fixed.\n"
             "Focus on writing a clear, detailed bug report with specifics about the issue that was resolved.\n"
             "DO NOT mention specific file paths or function names unless they appear in the issue."
         )
     else:
-        ending_instruction = (
-            "\nFirst, evaluate if this PR is substantial enough to generate a task.\n"
+        instruction_block = (
+            "First, evaluate if this PR is substantial enough to generate a task.\n"
             "Remember: PRs with changes to only 1-2 files are usually too trivial unless they involve major complexity.\n"
             "Look for changes across multiple source files that demonstrate real cross-component coordination.\n"
             "If substantial, write a detailed bug report describing the PROBLEM (not the solution).\n"
@@ -132,9 +159,11 @@ def _format_user_prompt(
 
     # MODE 1: Linked issues exist - use ONLY issue content (preferred)
     if linked_issues and len(linked_issues) > 0:
-        # Sort by body length (longer = more detail = more useful), take top N
+        # Sort by body length (longer = more detail = more useful), take top N.
+        # Issue number breaks ties so the prompt is deterministic.
         sorted_issues = sorted(
-            linked_issues, key=lambda x: len(x.get("body", "") or ""), reverse=True
+            linked_issues,
+            key=lambda x: (-len(x.get("body", "") or ""), x.get("number") or 0),
         )[:MAX_LINKED_ISSUES]
 
         issue_lines = []
@@ -143,8 +172,7 @@ def _format_user_prompt(
             issue_title = issue.get("title", "")
             issue_body = (issue.get("body", "") or "").strip()
             # Truncate issue body if too long
-            if len(issue_body) > MAX_ISSUE_BODY_LENGTH:
-                issue_body = issue_body[:MAX_ISSUE_BODY_LENGTH] + "\n...(truncated)"
+            issue_body = _truncate_utf8(issue_body, MAX_ISSUE_BODY_LENGTH)
 
             issue_lines.append(f"Issue #{issue_num}: {issue_title}")
             if issue_body:
@@ -153,63 +181,81 @@ def _format_user_prompt(
         issues_section = "\n".join(issue_lines)
 
         return (
-            f"Repository: {repo}\n"
+            instruction_block
+            + "\n\n"
+            + f"Repository: {repo}\n"
             f"PR Title: {pr_title}\n\n"
             f"Linked Issue(s) - USE THESE AS THE PRIMARY SOURCE:\n{issues_section}\n\n"
             f"Scope (for evaluation only): {source_files} source files, {tests} test files changed\n"
-            + ending_instruction
         )
 
     # MODE 2: No linked issue - use PR title + body, but warn LLM about solution leakage
-    pr_body_truncated = (pr_body or "").strip()
-    if len(pr_body_truncated) > MAX_PR_BODY_LENGTH:
-        pr_body_truncated = pr_body_truncated[:MAX_PR_BODY_LENGTH] + "\n...(truncated)"
+    pr_body_truncated = _truncate_utf8((pr_body or "").strip(), MAX_PR_BODY_LENGTH)
 
     return (
-        f"Repository: {repo}\n"
-        f"PR Title: {pr_title}\n\n"
-        + (f"PR Description:\n{pr_body_truncated}\n\n" if pr_body_truncated else "")
-        + f"Scope (for evaluation only): {source_files} source files, {tests} test files changed\n\n"
+        instruction_block
+        + "\n\n"
         "WARNING: No linked issue found. The PR description may contain solution details.\n"
         "Extract ONLY the problem description. Ignore any mentions of:\n"
         "- What was changed/fixed/updated\n"
         "- Which files or functions were modified\n"
         "- Implementation approach or code changes\n"
-        "Describe the PROBLEM that users would experience, not how it was fixed.\n"
-        + ending_instruction
+        "Describe the PROBLEM that users would experience, not how it was fixed.\n\n"
+        f"Repository: {repo}\n"
+        f"PR Title: {pr_title}\n\n"
+        + (f"PR Description:\n{pr_body_truncated}\n\n" if pr_body_truncated else "")
+        + f"Scope (for evaluation only): {source_files} source files, {tests} test files changed\n"
     )
 
 
-def evaluate_and_generate_task(
+def _response_cache_key(model: str, user_prompt: str) -> str:
+    """Deterministic cache key for one evaluation request (everything sent to the model)."""
+    payload = {
+        "model": model,
+        "system": COMBINED_SYSTEM_PROMPT,
+        "user": user_prompt,
+        "schema": CombinedPRTaskEvaluation.model_json_schema(),
+        "max_completion_tokens": MAX_COMPLETION_TOKENS,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def _load_cached_response(cache_file: Path) -> CombinedPRTaskEvaluation | None:
+    try:
+        return CombinedPRTaskEvaluation.model_validate_json(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_response(cache_file: Path, result: CombinedPRTaskEvaluation) -> None:
+    """Write the result atomically (tmp file + rename) so readers never see partial JSON."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+        tmp.write_text(result.model_dump_json())
+        os.replace(tmp, cache_file)
+    except OSError as exc:
+        logging.getLogger("taskgen").debug(f"Could not write evaluation cache: {exc}")
+
+
+def _prepare_request(
     metadata: dict,
     files: list[dict],
     repo: str,
-    model: str = "gpt-5-mini",
-    api_key: str | None = None,
-    linked_issues: list[dict] | None = None,
-    force_generate_instruction: bool = False,
-) -> CombinedPRTaskEvaluation:
-    """Evaluate PR substantiality and generate task description in one LLM call.
-
-    Uses OpenAI's structured outputs with the parse() method for type-safe responses.
-
-    Args:
-        metadata: PR metadata dict
-        files: List of changed files
-        repo: Repository name
-        model: OpenAI model to use
-        api_key: Optional OpenAI API key
-        linked_issues: Optional list of linked issue dicts (with 'title', 'body', 'number')
-        force_generate_instruction: If True, always generate an instruction even if PR seems trivial
+    model: str,
+    api_key: str | None,
+    linked_issues: list[dict] | None,
+    force_generate_instruction: bool,
+    cache_dir: Path | None,
+) -> tuple[str, Path | None, CombinedPRTaskEvaluation | None]:
+    """Build the user prompt and look it up in the response cache.
 
     Returns:
-        CombinedPRTaskEvaluation with evaluation and task details
+        Tuple of (user_prompt, cache_file, cached_result)
 
     Raises:
-        RuntimeError: If API key is missing or LLM call fails
+        RuntimeError: If API key is missing
     """
-    logger = logging.getLogger("taskgen")
-
     # Check API key
     if not (api_key or os.getenv("OPENAI_API_KEY")):
         raise RuntimeError("OPENAI_API_KEY not set")
@@ -229,57 +275,182 @@ def evaluate_and_generate_task(
         force_generate_instruction=force_generate_instruction,
     )
 
-    client = OpenAI(
-        api_key=api_key or os.getenv("OPENAI_API_KEY"),
-        timeout=OPENAI_API_TIMEOUT,  # Longer timeout for reasoning models
+    cache_file = None
+    cached = None
+    if cache_dir is not None:
+        cache_file = cache_dir / f"{_response_cache_key(model, user_prompt)}.json"
+        cached = _load_cached_response(cache_file)
+        if cached is not None:
+            logging.getLogger("taskgen").debug(
+                f"Combined evaluation: cache hit ({cache_file.name})"
+            )
+    return user_prompt, cache_file, cached
+
+
+def _parse_kwargs(model: str, user_prompt: str) -> dict:
+    """Arguments for client.beta.chat.completions.stream."""
+    return {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": COMBINED_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ],
+        "response_format": CombinedPRTaskEvaluation,
+        "max_completion_tokens": MAX_COMPLETION_TOKENS,
+        # "reasoning_effort": "low", # TODO: reasoning level?
+        "extra_body": {"prompt_cache_key": PROMPT_CACHE_KEY},
+    }
+
+
+def _early_trivial(event) -> CombinedPRTaskEvaluation | None:
+    """A "not substantial" verdict from a partial stream, once its reason is complete.
+
+    Structured outputs emit fields in schema order, so a key after "reason"
+    means the reason string is finished and the rest of the answer can be dropped.
+    """
+    if event.type != "content.delta" or not isinstance(event.parsed, dict):
+        return None
+    partial = event.parsed
+    if partial.get("is_substantial") is not False or len(partial) <= 2:
+        return None
+    logging.getLogger("taskgen").debug("Combined evaluation: trivial verdict, closing stream early")
+    return CombinedPRTaskEvaluation(is_substantial=False, reason=partial.get("reason") or "")
+
+
+def _check_result(
+    result: CombinedPRTaskEvaluation | None, cache_file: Path | None
+) -> CombinedPRTaskEvaluation:
+    """Validate the parsed result, fill defaults, and store it in the cache."""
+    logger = logging.getLogger("taskgen")
+
+    if result is None:
+        raise RuntimeError("LLM returned no parsed result")
+
+    logger.debug(
+        f"Combined evaluation: is_substantial={result.is_substantial}, reason={result.reason[:DEBUG_REASON_TRUNCATE_LENGTH]}..."
     )
 
-    try:
-        # Use structured outputs with parse() method - type-safe!
-        completion = client.beta.chat.completions.parse(
-            model=model,
-            messages=[
-                {"role": "system", "content": COMBINED_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format=CombinedPRTaskEvaluation,
-            max_completion_tokens=MAX_COMPLETION_TOKENS,
-            # reasoning_effort="low", # TODO: reasoning level?
-        )
+    # Post-process: validate tags if substantial
+    if result.is_substantial:
+        if len(result.tags) < 1:
+            logger.error(f"❌ LLM generated only {len(result.tags)} tags")
+            raise RuntimeError(f"LLM generated only {len(result.tags)} tags")
 
-        result = completion.choices[0].message.parsed
-        if result is None:
-            raise RuntimeError("LLM returned no parsed result")
+        # Validate instruction length
+        if not result.instruction or len(result.instruction.strip()) < MIN_INSTRUCTION_LENGTH:
+            logger.error(
+                f"❌ LLM generated instruction too short: {len(result.instruction) if result.instruction else 0} chars"
+            )
+            raise RuntimeError(
+                f"Instruction too short: {len(result.instruction) if result.instruction else 0} chars (need {MIN_INSTRUCTION_LENGTH}+)"
+            )
 
-        logger.debug(
-            f"Combined evaluation: is_substantial={result.is_substantial}, reason={result.reason[:DEBUG_REASON_TRUNCATE_LENGTH]}..."
-        )
+        # Ensure defaults
+        if not result.difficulty:
+            result.difficulty = "medium"
+        if not result.category:
+            result.category = "bugfix"
+
+    if cache_file is not None:
+        _store_cached_response(cache_file, result)
+    return result
+
+
+@functools.lru_cache(maxsize=4)
+def _client(api_key: str | None) -> OpenAI:
+    """Shared client per API key, so PRs reuse its connection pool."""
+    # The SDK is heavy; import it only once a PR actually needs the API
+    from openai import OpenAI
+
+    # Longer timeout for reasoning models
+    return OpenAI(api_key=api_key, timeout=OPENAI_API_TIMEOUT)
+
+
+def _call_failed(exc: Exception) -> RuntimeError:
+    # Log the specific exception type for better debugging
+    exc_type = type(exc).__name__
+    logging.getLogger("taskgen").error(f"Combined LLM call failed ({exc_type}): {exc}")
+    return RuntimeError(f"Combined LLM call failed: {exc}")
+
+
+def evaluate_and_generate_task(
+    metadata: dict,
+    files: list[dict],
+    repo: str,
+    model: str = "gpt-5-mini",
+    api_key: str | None = None,
+    linked_issues: list[dict] | None = None,
+    force_generate_instruction: bool = False,
+    cache_dir: Path | None = None,
+    semantic_cache: bool = False,
+) -> CombinedPRTaskEvaluation:
+    """Evaluate PR substantiality and generate task description in one LLM call.
+
+    Uses OpenAI's streaming structured outputs for type-safe responses; a trivial
+    verdict closes the stream as soon as its reason is complete.
+    When cache_dir is given, validated results are stored there keyed by a hash of
+    the full request, so re-running the same PR skips the API call. With
+    semantic_cache, trivial verdicts are also reused for near-duplicate PRs
+    (see SemanticEvaluationCache).
+
+    Args:
+        metadata: PR metadata dict
+        files: List of changed files
+        repo: Repository name
+        model: OpenAI model to use
+        api_key: Optional OpenAI API key
+        linked_issues: Optional list of linked issue dicts (with 'title', 'body', 'number')
+        force_generate_instruction: If True, always generate an instruction even if PR seems trivial
+        cache_dir: Optional directory for the on-disk response cache
+        semantic_cache: Reuse trivial verdicts of near-duplicate PRs (needs cache_dir)
 
-        # Post-process: validate tags if substantial
-        if result.is_substantial:
-            if len(result.tags) < 1:
-                logger.error(f"❌ LLM generated only {len(result.tags)} tags")
-                raise RuntimeError(f"LLM generated only {len(result.tags)} tags")
-
-            # Validate instruction length
-            if not result.instruction or len(result.instruction.strip()) < MIN_INSTRUCTION_LENGTH:
-                logger.error(
-                    f"❌ LLM generated instruction too short: {len(result.instruction) if result.instruction else 0} chars"
-                )
-                raise RuntimeError(
-                    f"Instruction too short: {len(result.instruction) if result.instruction else 0} chars (need {MIN_INSTRUCTION_LENGTH}+)"
-                )
-
-            # Ensure defaults
-            if not result.difficulty:
-                result.difficulty = "medium"
-            if not result.category:
-                result.category = "bugfix"
-
-        return result
+    Returns:
+        CombinedPRTaskEvaluation with evaluation and task details
 
+    Raises:
+        RuntimeError: If API key is missing or LLM call fails
+    """
+    user_prompt, cache_file, cached = _prepare_request(
+        metadata, files, repo, model, api_key, linked_issues, force_generate_instruction, cache_dir
+    )
+    if cached is not None:
+        return cached
+
+    client = _client(api_key or os.getenv("OPENAI_API_KEY"))
+
+    # A forced instruction must not be answered with another PR's "trivial" verdict
+    semantic = None
+    if semantic_cache and cache_dir is not None and not force_generate_instruction:
+        pr_text = SemanticEvaluationCache.text_for(
+            metadata.get("title", ""), metadata.get("body", "")
+        )
+        try:
+            semantic = SemanticEvaluationCache(cache_dir / "semantic.sqlite3", client)
+            reused = semantic.lookup(repo, pr_text)
+        except Exception as exc:
+            logging.getLogger("taskgen").debug(f"Semantic cache lookup failed: {exc}")
+            semantic, reused = None, None
+        if reused is not None:
+            return reused
+
+    try:
+        # Stream the structured output so a trivial verdict can close the connection
+        # before the remaining (useless) fields are generated.
+        parsed = None
+        with client.beta.chat.completions.stream(**_parse_kwargs(model, user_prompt)) as stream:
+            for event in stream:
+                parsed = _early_trivial(event)
+                if parsed is not None:
+                    break
+            else:
+                parsed = stream.get_final_completion().choices[0].message.parsed
+        result = _check_result(parsed, cache_file)
     except Exception as exc:
-        # Log the specific exception type for better debugging
-        exc_type = type(exc).__name__
-        logger.error(f"Combined LLM call failed ({exc_type}): {exc}")
-        raise RuntimeError(f"Combined LLM call failed: {exc}") from exc
+        raise _call_failed(exc) from exc
+
+    if semantic is not None:
+        try:
+            semantic.store(repo, pr_text, result)
+        except Exception as exc:
+            logging.getLogger("taskgen").debug(f"Semantic cache store failed: {exc}")
+    return result
@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
 logger = logging.getLogger("taskgen")
 
+# Farm workers save references concurrently; serialize the load-update-save.
+_save_lock = threading.Lock()
+
 
 @dataclass
 class TaskReference:
@@ -47,7 +52,10 @@ class TaskReferenceStore:
     def _save_references(self, references: dict[str, TaskReference]) -> None:
         """Save all references to file."""
         data = {repo: asdict(ref) for repo, ref in references.items()}
-        self.reference_file.write_text(json.dumps(data, indent=2))
+        # Write-then-rename so readers never see a half-written file
+        tmp = self.reference_file.with_name(self.reference_file.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2))
+        os.replace(tmp, self.reference_file)
 
     def save(
         self,
@@ -76,9 +84,10 @@ class TaskReferenceStore:
             )
 
             # Load, update, save
-            references = self._load_references()
-            references[repo] = reference
-            self._save_references(references)
+            with _save_lock:
+                references = self._load_references()
+                references[repo] = reference
+                self._save_references(references)
 
             logger.info(f"✓ Saved task reference for {repo} → {task_id}")
             return True
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import functools
+import re
 import shutil
 import time
 import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -20,17 +24,19 @@ def _now_utc() -> datetime:
     return datetime.now(UTC)
 
 
+@functools.lru_cache(maxsize=32)
 def _slug(repo: str) -> str:
     """Convert repo to slug using SWEBench convention: owner/repo -> owner__repo"""
     return repo.replace("/", "__")
 
 
+@functools.lru_cache(maxsize=4096)
 def _task_id(repo: str, pr_number: int) -> str:
     """Generate task ID using SWEBench convention: owner__repo-number"""
     return f"{_slug(repo)}-{pr_number}"
 
 
-@dataclass
+@dataclass(slots=True)
 class PRCandidate:
     """A candidate PR for task generation."""
 
@@ -45,7 +51,7 @@ class PRCandidate:
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Result of processing a single PR into a task."""
 
@@ -58,42 +64,91 @@ class TaskResult:
     timestamp: str
 
 
+# Deletes failed task directories off the farm loop. Worker threads are joined at
+# interpreter exit, so queued deletions still finish.
+_rmtree_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="taskgen-rmtree")
+
+
+def _task_roots(tasks_root: Path) -> tuple[Path, ...]:
+    """Directories a task ID may have been written under."""
+    return (tasks_root, Path("trash"))
+
+
+def _trash_dir(root: Path) -> Path:
+    """Hidden directory under root that holds tasks awaiting deletion."""
+    return root / ".trash"
+
+
+def _remove_in_background(path: Path) -> None:
+    """Move path aside (instant rename) and delete it on a background thread.
+
+    The rename frees the task ID immediately; the target lives under a hidden
+    .trash/ directory so dataset scans never see a half-deleted task.
+    """
+    doomed = _trash_dir(path.parent) / f"{path.name}-{uuid.uuid4().hex}"
+    try:
+        doomed.parent.mkdir(exist_ok=True)
+        path.rename(doomed)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    _rmtree_executor.submit(shutil.rmtree, doomed, ignore_errors=True)
+
+
+def _sweep_trash(tasks_root: Path) -> None:
+    """Finish deletions a previous run left in .trash/ (e.g. it exited mid-rmtree)."""
+    for root in _task_roots(tasks_root):
+        try:
+            leftovers = list(_trash_dir(root).iterdir())
+        except OSError:
+            continue
+        for doomed in leftovers:
+            _rmtree_executor.submit(shutil.rmtree, doomed, ignore_errors=True)
+
+
 def _cleanup_task(task_id: str, tasks_root: Path, console: Console) -> None:
     removed_any = False
-    paths = [
-        tasks_root / task_id,
-        Path("trash") / task_id,
-    ]
-    for path in paths:
+    for root in _task_roots(tasks_root):
+        path = root / task_id
         if path.exists():
-            shutil.rmtree(path, ignore_errors=True)
+            _remove_in_background(path)
             removed_any = True
     if removed_any:
         console.print(f"[dim]Cleaned up incomplete task directory: {task_id}[/dim]")
 
 
+# (pattern, reason) in priority order; the first rule that matches wins.
+# "trivial" and "no test" match case-sensitively.
+_FAILURE_RULES: tuple[tuple[re.Pattern[str], str], ...] = (
+    (re.compile("trivial"), "Trivial PR (skipped)"),
+    (re.compile("no linked issue|missingissueerror", re.I), "No linked issue (skipped)"),
+    (
+        re.compile("validation failed|harbor validation", re.I),
+        "Validation failed (NOP or Oracle)",
+    ),
+    (re.compile("task already exists|file exists", re.I), "Task already exists (skipped)"),
+    (re.compile("no test"), "No tests detected"),
+    (
+        re.compile("rate limit exceeded.*github|github.*rate limit exceeded", re.I | re.S),
+        "GitHub API rate limit exceeded (set GITHUB_TOKEN)",
+    ),
+    (
+        re.compile("insufficient_quota|exceeded your current quota", re.I),
+        "OpenAI API quota exceeded (check billing)",
+    ),
+    (re.compile("timed out|timeout", re.I), "Command timed out"),
+    (
+        re.compile("cannot checkout commit|force-pushed or deleted", re.I),
+        "Git commit not found (may be force-pushed or deleted)",
+    ),
+    (re.compile("git checkout", re.I), "Git checkout failed (repo cache may be corrupted)"),
+)
+
+
 def _classify_failure(stderr: str) -> str:
-    lowered = stderr.lower()
-    if "trivial" in stderr:
-        return "Trivial PR (skipped)"
-    if "no linked issue" in lowered or "missingissueerror" in lowered:
-        return "No linked issue (skipped)"
-    if "validation failed" in lowered or "harbor validation" in lowered:
-        return "Validation failed (NOP or Oracle)"
-    if "task already exists" in lowered or "file exists" in lowered:
-        return "Task already exists (skipped)"
-    if "no test" in stderr:
-        return "No tests detected"
-    if "rate limit exceeded" in lowered and "github" in lowered:
-        return "GitHub API rate limit exceeded (set GITHUB_TOKEN)"
-    if "insufficient_quota" in lowered or "exceeded your current quota" in lowered:
-        return "OpenAI API quota exceeded (check billing)"
-    if "timed out" in lowered or "timeout" in lowered:
-        return "Command timed out"
-    if "cannot checkout commit" in lowered or "force-pushed or deleted" in lowered:
-        return "Git commit not found (may be force-pushed or deleted)"
-    if "git checkout" in lowered:
-        return "Git checkout failed (repo cache may be corrupted)"
+    for pattern, reason in _FAILURE_RULES:
+        if pattern.search(stderr):
+            return reason
     return (stderr or "Unknown error").replace("\n", " ")
 
 
@@ -134,6 +189,7 @@ def _run_reversal_for_pr(
     config: FarmConfig,
     tasks_root: Path,
     console: Console,
+    repo_cache_dir: Path | None = None,
 ) -> TaskResult:
     start = time.time()
     task_id = _task_id(config.repo, pr.number)
@@ -142,7 +198,7 @@ def _run_reversal_for_pr(
     # Wrap everything in try-except to catch unexpected errors
     try:
         return _run_reversal_for_pr_impl(
-            pr, config, tasks_root, console, task_id, harbor_dir, start
+            pr, config, tasks_root, console, task_id, harbor_dir, start, repo_cache_dir
         )
     except Exception as e:
         # Catch any unexpected exception and return proper error
@@ -169,6 +225,7 @@ def _run_reversal_for_pr_impl(
     task_id: str,
     harbor_dir: Path,
     start: float,
+    repo_cache_dir: Path | None = None,
 ) -> TaskResult:
     if config.dry_run:
         console.print(f"[cyan]DRY RUN[/cyan] would generate task for PR #{pr.number} -> {task_id}")
@@ -200,6 +257,10 @@ def _run_reversal_for_pr_impl(
         max_source_files=config.max_source_files,
         require_issue=config.issue_only,
         environment=config.environment,
+        repo_cache_dir=repo_cache_dir,
+        semantic_cache=config.semantic_cache,
+        # Concurrent PRs would each start a live display on the same terminal
+        live_status=config.max_parallel <= 1,
     )
 
     # Capture any errors from the pipeline
@@ -16,7 +16,7 @@ from .farm_hand import PRCandidate, _slug
 from .state import StreamState
 
 
-def load_skip_list(skip_list_file: Path, repo: str) -> set[int]:
+def load_skip_list(skip_list_file: Path, repo: str) -> frozenset[int]:
     """Load PR numbers from a skip list file for the given repository.
 
     The file should contain task IDs like (SWEBench format):
@@ -30,10 +30,10 @@ def load_skip_list(skip_list_file: Path, repo: str) -> set[int]:
         repo: Repository in owner/repo format (e.g., "python/pillow")
 
     Returns:
-        Set of PR numbers to skip
+        Frozen set of PR numbers to skip (read once, then only used for lookups)
     """
     if not skip_list_file.exists():
-        return set()
+        return frozenset()
 
     # Create expected prefix from repo (e.g., "python/pillow" -> "python__pillow-")
     repo_slug = _slug(repo)
@@ -42,7 +42,7 @@ def load_skip_list(skip_list_file: Path, repo: str) -> set[int]:
     skip_prs: set[int] = set()
     try:
         content = skip_list_file.read_text()
-        for line in content.strip().split("\n"):
+        for line in content.splitlines():
             line = line.strip()
             if not line or line.startswith("#"):
                 continue
@@ -61,7 +61,7 @@ def load_skip_list(skip_list_file: Path, repo: str) -> set[int]:
         # If file read fails, return empty set
         pass
 
-    return skip_prs
+    return frozenset(skip_prs)
 
 
 class StreamingPRFetcher:
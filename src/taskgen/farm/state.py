@@ -1,12 +1,36 @@
 from __future__ import annotations
 
+import base64
 import json
-from dataclasses import dataclass
+import os
+import time
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 
 
-@dataclass
+def _encode_pr_bitmap(prs: set[int]) -> str:
+    """Pack PR numbers into a base64 bitmap (bit n set = PR #n processed)."""
+    if not prs:
+        return ""
+    bitmap = bytearray(max(prs) // 8 + 1)
+    for n in prs:
+        bitmap[n >> 3] |= 1 << (n & 7)
+    return base64.b64encode(bitmap).decode("ascii")
+
+
+def _decode_pr_bitmap(encoded: str) -> set[int]:
+    """Inverse of _encode_pr_bitmap()."""
+    prs = set()
+    for i, byte in enumerate(base64.b64decode(encoded)):
+        while byte:
+            low = byte & -byte
+            prs.add(i * 8 + low.bit_length() - 1)
+            byte ^= low
+    return prs
+
+
+@dataclass(slots=True)
 class StreamState:
     """State for resumable streaming PR processing.
 
@@ -27,7 +51,7 @@ class StreamState:
     """
 
     repo: str
-    processed_prs: set[int] = None
+    processed_prs: set[int] = field(default_factory=set)
     total_fetched: int = 0
     total_processed: int = 0
     successful: int = 0
@@ -35,37 +59,38 @@ class StreamState:
     last_pr_number: int | None = None
     last_created_at: str | None = None
     last_updated: str | None = None
-    skip_list_prs: set[int] = None
+    skip_list_prs: frozenset[int] = frozenset()
+    # Bookkeeping for maybe_save(); not persisted
+    _dirty: int = field(default=0, init=False, repr=False, compare=False)
+    _last_save: float = field(default=0.0, init=False, repr=False, compare=False)
 
-    def __post_init__(self):
-        if self.processed_prs is None:
-            self.processed_prs = set()
-        if self.skip_list_prs is None:
-            self.skip_list_prs = set()
-
-    def mark_processed(self, pr_number: int, created_at: str, success: bool) -> None:
+    def mark_processed(self, pr_number: int, created_at: str | None, success: bool) -> None:
         """Mark a PR as processed and update counters.
 
         Args:
             pr_number: The PR number that was processed
-            created_at: ISO timestamp of when the PR was created
+            created_at: ISO timestamp of when the PR was created, or None to leave the
+                resume point where it is (a newer PR is still in flight)
             success: Whether the task generation succeeded
         """
         self.processed_prs.add(pr_number)
+        self._dirty += 1
         self.total_processed += 1
         if success:
             self.successful += 1
         else:
             self.failed += 1
         self.last_pr_number = pr_number
-        self.last_created_at = created_at
+        if created_at is not None:
+            self.last_created_at = created_at
         self.last_updated = datetime.now(UTC).isoformat()
 
     def to_dict(self) -> dict:
         """Convert to dict for JSON serialization."""
         return {
             "repo": self.repo,
-            "processed_prs": list(self.processed_prs),
+            # PR numbers are small and dense, so a bitmap stays far smaller than a list
+            "processed_prs_bitmap": _encode_pr_bitmap(self.processed_prs),
             "total_fetched": self.total_fetched,
             "total_processed": self.total_processed,
             "successful": self.successful,
@@ -85,9 +110,14 @@ class StreamState:
         Returns:
             StreamState instance
         """
+        if "processed_prs_bitmap" in data:
+            processed_prs = _decode_pr_bitmap(data["processed_prs_bitmap"])
+        else:
+            # State files written before the bitmap encoding
+            processed_prs = set(data.get("processed_prs", []))
         return cls(
             repo=data["repo"],
-            processed_prs=set(data.get("processed_prs", [])),
+            processed_prs=processed_prs,
             total_fetched=data.get("total_fetched", 0),
             total_processed=data.get("total_processed", 0),
             successful=data.get("successful", 0),
@@ -104,7 +134,35 @@ class StreamState:
             state_file: Path to save state to
         """
         state_file.parent.mkdir(parents=True, exist_ok=True)
-        state_file.write_text(json.dumps(self.to_dict(), indent=2))
+        # Write-then-rename so an interrupted save never leaves a truncated file
+        tmp = state_file.with_name(f".{state_file.name}.tmp")
+        # Compact output: the file is machine state (the PR list is a bitmap anyway)
+        tmp.write_text(json.dumps(self.to_dict(), separators=(",", ":")))
+        os.replace(tmp, state_file)
+        self._dirty = 0
+        self._last_save = time.monotonic()
+
+    def maybe_save(
+        self, state_file: Path, min_interval_s: float = 5.0, every_n: int = 25
+    ) -> bool:
+        """Save only if enough time or enough PRs have passed since the last save.
+
+        Callers must still call save() on shutdown to flush pending changes.
+
+        Args:
+            state_file: Path to save state to
+            min_interval_s: Save if at least this many seconds passed since the last save
+            every_n: Save if at least this many PRs were marked since the last save
+
+        Returns:
+            True if the state was written
+        """
+        if not self._dirty:
+            return False
+        if self._dirty < every_n and time.monotonic() - self._last_save < min_interval_s:
+            return False
+        self.save(state_file)
+        return True
 
     @classmethod
     def load(cls, state_file: Path, repo: str) -> StreamState:
@@ -119,7 +177,7 @@ class StreamState:
         """
         if state_file.exists():
             try:
-                data = json.loads(state_file.read_text())
+                data = json.loads(state_file.read_bytes())
                 if data.get("repo") == repo:
                     return cls.from_dict(data)
             except Exception:
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import itertools
 import json
 import shutil
 import signal
 import subprocess
+import threading
 import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import asdict
 from datetime import UTC, datetime
 from pathlib import Path
@@ -23,6 +28,7 @@ from .farm_hand import (
     _now_utc,
     _run_reversal_for_pr,
     _slug,
+    _sweep_trash,
 )
 from .fetcher import StreamingPRFetcher, load_skip_list
 from .state import StreamState
@@ -100,6 +106,16 @@ class StreamFarmer:
         # Results tracking
         self.results: list[TaskResult] = []
 
+        # Parallel mode (--max-parallel > 1): state, output and docker prune are
+        # serialized, and each worker thread gets its own repo clone.
+        self._lock = threading.Lock()
+        self._worker = threading.local()
+        self._worker_ids = itertools.count()
+        # PRs handed to workers, newest first as fetched, until a contiguous prefix
+        # has finished; only that prefix may move the resume point (see _resume_point)
+        self._submitted: deque[PRCandidate] = deque()
+        self._finished: set[int] = set()
+
         # Graceful shutdown handling
         self.shutdown_requested = False
         signal.signal(signal.SIGINT, self._handle_shutdown)
@@ -160,6 +176,7 @@ class StreamFarmer:
             Exit code: 0 if any tasks succeeded, 1 otherwise
         """
         self._print_header()
+        _sweep_trash(self.tasks_root)
 
         # Start streaming and processing
         try:
@@ -191,57 +208,139 @@ class StreamFarmer:
         )
 
     def _run_stream(self) -> None:
-        """Process PRs synchronously: fetch one, process it, repeat."""
+        """Process PRs as they stream in: fetch one, process it, repeat."""
         self.console.print("[cyan]Streaming and processing PRs...[/cyan]\n")
 
-        for pr in self.fetcher.stream_prs(resume_from_time=self.resume_from_time):
+        prs = self.fetcher.stream_prs(resume_from_time=self.resume_from_time)
+        if self.config.max_parallel > 1:
+            self._run_stream_parallel(prs)
+            return
+
+        for pr in prs:
             if self.shutdown_requested:
                 self.console.print("[yellow]Shutdown requested, stopping...[/yellow]")
                 break
 
             self._process_pr(pr)
 
+    def _run_stream_parallel(self, prs: Iterator[PRCandidate]) -> None:
+        """Keep up to max_parallel PRs in flight, pulling the next PR as one finishes.
+
+        Args:
+            prs: PR stream from the fetcher (consumed lazily, never read ahead)
+        """
+        workers = self.config.max_parallel
+        prune_every = self.config.docker_prune_batch
+        with self._lock:
+            last_prune = self.state.total_processed
+        in_flight: set[Future] = set()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="farm") as pool:
+            for pr in prs:
+                while len(in_flight) >= workers:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                if self.shutdown_requested:
+                    self.console.print(
+                        "[yellow]Shutdown requested, waiting for in-flight PRs...[/yellow]"
+                    )
+                    break
+                with self._lock:
+                    processed = self.state.total_processed
+                if prune_every > 0 and processed - last_prune >= prune_every:
+                    # Drain first: pruning under running trials would remove the images
+                    # and networks they are using.
+                    for future in wait(in_flight).done:
+                        future.result()
+                    in_flight = set()
+                    with self._lock:
+                        last_prune = self.state.total_processed
+                    self._prune_docker()
+                with self._lock:
+                    self._submitted.append(pr)
+                in_flight.add(pool.submit(self._process_pr, pr))
+            for future in wait(in_flight).done:
+                future.result()
+
+    def _worker_repo_cache(self) -> Path | None:
+        """Repo clone dir for the calling worker thread (None in sequential mode).
+
+        Concurrent PRs check out different commits, so they cannot share the
+        single clone that create keeps under <state_dir>/repos.
+        """
+        if self.config.max_parallel <= 1:
+            return None
+        if not hasattr(self._worker, "repo_cache"):
+            worker_id = next(self._worker_ids)
+            self._worker.repo_cache = self.config.state_dir / "repos" / f"worker-{worker_id}"
+        return self._worker.repo_cache
+
+    def _resume_point(self, finished: PRCandidate) -> str | None:
+        """created_at to resume from now that `finished` is done (call under _lock).
+
+        PRs stream newest first and a resume only fetches PRs created before the
+        saved point, so in parallel mode the point may only move past PRs that have
+        finished with every newer PR. Returns None while a newer PR is still running.
+        """
+        if self.config.max_parallel <= 1:
+            return finished.created_at
+        self._finished.add(finished.number)
+        created_at = None
+        while self._submitted and self._submitted[0].number in self._finished:
+            done = self._submitted.popleft()
+            self._finished.discard(done.number)
+            created_at = done.created_at
+        return created_at
+
     def _process_pr(self, pr: PRCandidate) -> None:
         """Process a single PR candidate.
 
         Args:
             pr: The PR candidate to process
         """
-        # Print PR header
-        merged_dt = datetime.fromisoformat(pr.merged_at.replace("Z", "+00:00"))
-        self.console.print(
-            f"\n[bold cyan]═══ PR #{pr.number} ({self.state.total_processed + 1}) ═══[/bold cyan]"
-        )
-        self.console.print(f"[bold]{pr.title}[/bold]")
-        self.console.print(
-            f"[dim]Merged: {merged_dt.strftime('%Y-%m-%d %H:%M:%S UTC')} | "
-            f"Files: {pr.files_changed} | "
-            f"+{pr.additions}/-{pr.deletions}[/dim]"
-        )
+        with self._lock:
+            # Print PR header
+            merged_dt = datetime.fromisoformat(pr.merged_at.replace("Z", "+00:00"))
+            self.console.print(
+                f"\n[bold cyan]═══ PR #{pr.number} ({self.state.total_processed + 1}) ═══[/bold cyan]"
+            )
+            self.console.print(f"[bold]{pr.title}[/bold]")
+            self.console.print(
+                f"[dim]Merged: {merged_dt.strftime('%Y-%m-%d %H:%M:%S UTC')} | "
+                f"Files: {pr.files_changed} | "
+                f"+{pr.additions}/-{pr.deletions}[/dim]"
+            )
 
         # Process this PR completely before moving to next
-        result = _run_reversal_for_pr(pr, self.config, self.tasks_root, self.console)
-        self.results.append(result)
+        result = _run_reversal_for_pr(
+            pr, self.config, self.tasks_root, self.console, self._worker_repo_cache()
+        )
 
-        # Mark as processed
-        self.state.mark_processed(pr.number, pr.created_at, result.status == "success")
-        self._save_state()
+        with self._lock:
+            self.results.append(result)
+
+            # Mark as processed
+            self.state.mark_processed(pr.number, self._resume_point(pr), result.status == "success")
+            self.state.maybe_save(self.state_file)  # _finalize() flushes the rest
+            processed = self.state.total_processed
 
-        # Show result
-        self._print_result(result)
+            # Show result
+            self._print_result(result)
 
         # Rate limit protection: sleep between PRs
         self.console.print(f"[dim]Waiting {self.config.task_delay} seconds before next PR...[/dim]")
         time.sleep(self.config.task_delay)
 
-        # Periodic summary
-        if self.state.total_processed % 10 == 0:
-            self._print_progress()
+        with self._lock:
+            # Periodic summary
+            if processed % 10 == 0:
+                self._print_progress()
 
-        # Docker cleanup after batch
-        if self.config.docker_prune_batch > 0:
-            if self.state.total_processed % self.config.docker_prune_batch == 0:
-                self._prune_docker()
+            # Docker cleanup after batch (parallel mode drains workers and prunes
+            # from _run_stream_parallel instead)
+            if self.config.docker_prune_batch > 0 and self.config.max_parallel <= 1:
+                if processed % self.config.docker_prune_batch == 0:
+                    self._prune_docker()
 
     def _print_result(self, result: TaskResult) -> None:
         """Print the result of processing a PR.
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 import shutil
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -17,7 +19,32 @@ class CleanPlan:
 
 
 def _existing_only(paths: Iterable[Path]) -> list[Path]:
-    return [p for p in paths if p and p.exists()]
+    # Candidates mostly share a parent (.state/), so list each parent once
+    # instead of stat()ing every candidate.
+    names_by_parent: dict[Path, set[str] | None] = {}
+    existing = []
+    for p in paths:
+        if not p:
+            continue
+        if p.parent not in names_by_parent:
+            try:
+                with os.scandir(p.parent) as it:
+                    # Like exists(), a dangling symlink doesn't count
+                    names_by_parent[p.parent] = {
+                        entry.name
+                        for entry in it
+                        if not entry.is_symlink() or os.path.exists(entry.path)
+                    }
+            except OSError:
+                names_by_parent[p.parent] = None
+        names = names_by_parent[p.parent]
+        if names is None:  # Unlistable parent: fall back to a plain stat
+            found = p.exists()
+        else:
+            found = p.name in names
+        if found:
+            existing.append(p)
+    return existing
 
 
 def build_clean_plan(
@@ -56,22 +83,31 @@ def build_clean_plan(
     return CleanPlan(dirs=_existing_only(dirs), files=_existing_only(files))
 
 
+def _rmtree(d: Path) -> int:
+    try:
+        shutil.rmtree(d, ignore_errors=True)
+        return 1
+    except Exception:
+        return 0
+
+
+def _unlink(f: Path) -> int:
+    try:
+        f.unlink(missing_ok=True)
+        return 1
+    except Exception:
+        return 0
+
+
 def execute_clean(plan: CleanPlan) -> tuple[int, int]:
-    n_dirs = 0
-    n_files = 0
-    for d in plan.dirs:
-        try:
-            shutil.rmtree(d, ignore_errors=True)
-            n_dirs += 1
-        except Exception:
-            pass
-    for f in plan.files:
-        try:
-            f.unlink(missing_ok=True)
-            n_files += 1
-        except Exception:
-            pass
-    return n_dirs, n_files
+    # Removals are independent and I/O bound, so overlap them. A dir nested in
+    # another planned dir goes away with its parent; it is counted, not re-walked.
+    roots = [d for d in plan.dirs if not any(p in d.parents for p in plan.dirs)]
+    n_nested = len(plan.dirs) - len(roots)
+    with ThreadPoolExecutor(max_workers=min(8, len(roots) + len(plan.files)) or 1) as ex:
+        dir_results = ex.map(_rmtree, roots)
+        file_results = ex.map(_unlink, plan.files)
+        return sum(dir_results) + n_nested, sum(file_results)
 
 
 def run_clean(
@@ -127,7 +127,7 @@ def parse_harbor_outcome(job_result_path: Path | None) -> HarborOutcome:
 
     try:
         # Use Harbor's JobResult model for type-safe parsing
-        job_result = JobResult.model_validate_json(job_result_path.read_text())
+        job_result = JobResult.model_validate_json(job_result_path.read_bytes())
 
         # Prefer structured exception info from typed trial results.
         error: str | None = None
@@ -169,7 +169,7 @@ def parse_harbor_outcome(job_result_path: Path | None) -> HarborOutcome:
                 trial_paths = TrialPaths(trial_dir)
                 if not trial_paths.result_path.exists():
                     continue
-                trial_result = TrialResult.model_validate_json(trial_paths.result_path.read_text())
+                trial_result = TrialResult.model_validate_json(trial_paths.result_path.read_bytes())
 
                 if error is None and getattr(trial_result, "exception_info", None):
                     exc = trial_result.exception_info
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import os
 from collections.abc import Generator
 from pathlib import Path
 
@@ -13,6 +14,8 @@ networks:
     internal: true
 """
 
+_OVERRIDE_BYTES = NETWORK_ISOLATION_OVERRIDE.encode("utf-8")
+
 OVERRIDE_FILENAME = "docker-compose.override.yaml"
 
 
@@ -38,17 +41,21 @@ def network_isolation(task_dir: Path) -> Generator[Path, None, None]:
     task_dir = Path(task_dir)
     override_path = task_dir / OVERRIDE_FILENAME
 
-    # Check if override already exists (don't overwrite user's file)
-    existing = override_path.exists()
-    if existing:
-        # Just yield the existing path without modifying
-        yield override_path
-        return
-
+    # Create atomically so a concurrent validator (or the user's own override)
+    # is never overwritten; O_EXCL fails if the file already exists, in which
+    # case the existing file is yielded untouched.
+    created = False
     try:
-        override_path.write_text(NETWORK_ISOLATION_OVERRIDE)
+        try:
+            fd = os.open(override_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            pass
+        else:
+            created = True
+            with os.fdopen(fd, "wb") as f:
+                f.write(_OVERRIDE_BYTES)
         yield override_path
     finally:
-        # Clean up the override file
-        if override_path.exists() and not existing:
-            override_path.unlink()
+        # Clean up only the override file we created
+        if created:
+            override_path.unlink(missing_ok=True)
@@ -1,18 +1,31 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import os
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TextIO
 
 from harbor.models.environment_type import EnvironmentType
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 from rich.table import Table
 
+from taskgen.config import VALIDATE_AGENTS
+
 from .harbor_runner import parse_harbor_outcome, run_harbor_agent
 from .network_isolation import network_isolation
 
+# Batch --output-file: 1 MiB write buffer, flushed every N completed results
+_OUTPUT_BUFFER_BYTES = 1 << 20
+_OUTPUT_FLUSH_EVERY = 32
+# Batch progress bar: redraws per second, and push counts at that same rate
+_PROGRESS_REFRESH_PER_SECOND = 4
+_PROGRESS_TICK_S = 1 / _PROGRESS_REFRESH_PER_SECOND
+
 
 @dataclass
 class ValidateArgs:
@@ -29,6 +42,10 @@ class ValidateArgs:
     show_passed: bool = False
     output_file: Path | None = None  # Write results to file as they complete
 
+    def __post_init__(self) -> None:
+        if self.agent not in VALIDATE_AGENTS:
+            raise ValueError(f"agent must be one of: {', '.join(sorted(VALIDATE_AGENTS))}")
+
 
 @dataclass
 class ValidationResult:
@@ -43,14 +60,44 @@ class ValidationResult:
     error: str | None = None
 
 
+@dataclass
+class BatchResults:
+    """Batch results bucketed by outcome as they complete.
+
+    Passes are only counted unless keep_passed is set (--show-passed), since
+    nothing else reads them and they are the bulk of a healthy batch.
+    """
+
+    keep_passed: bool = False
+    n_passed: int = 0
+    passed: list[ValidationResult] = field(default_factory=list)
+    failed: list[ValidationResult] = field(default_factory=list)
+    errors: list[ValidationResult] = field(default_factory=list)
+
+    def add(self, result: ValidationResult) -> None:
+        if result.error:
+            self.errors.append(result)
+        elif result.passed:
+            self.n_passed += 1
+            if self.keep_passed:
+                self.passed.append(result)
+        else:
+            self.failed.append(result)
+
+    def __len__(self) -> int:
+        return self.n_passed + len(self.failed) + len(self.errors)
+
+
 def run_validate(args: ValidateArgs) -> None:
     """Main entry point - routes to single or batch validation."""
     dataset_path, task_id, task_dir = _resolve_paths(args)
+    jobs_dir = args.jobs_dir.resolve()
+    jobs_dir.mkdir(parents=True, exist_ok=True)
 
     if task_id is None:
-        _run_batch_mode(args, dataset_path)
+        _run_batch_mode(args, dataset_path, jobs_dir)
     else:
-        _run_single_mode(args, dataset_path, task_id, task_dir)
+        _run_single_mode(args, dataset_path, task_id, task_dir, jobs_dir)
 
 
 def _resolve_paths(args: ValidateArgs) -> tuple[Path, str | None, Path | None]:
@@ -65,14 +112,13 @@ def _resolve_paths(args: ValidateArgs) -> tuple[Path, str | None, Path | None]:
         # Explicit task ID: single mode
         return path, args.task, path / args.task
 
-    if path.is_dir() and (path / "tests" / "test.sh").exists():
-        # Path is a task directory: single mode
-        return path.parent, path.name, path
-
     if path.is_dir():
+        if (path / "tests" / "test.sh").exists():
+            # Path is a task directory: single mode
+            return path.parent, path.name, path
+
         # Check if directory contains tasks: batch mode
-        tasks = [d for d in path.iterdir() if d.is_dir() and (d / "tests" / "test.sh").exists()]
-        if tasks:
+        if _find_task_dirs(path):
             return path, None, None
         raise SystemExit(
             f"No tasks found in directory: {path}\nExpected directories with tests/test.sh"
@@ -85,16 +131,32 @@ def _resolve_paths(args: ValidateArgs) -> tuple[Path, str | None, Path | None]:
     )
 
 
+def _find_task_dirs(dataset_path: Path) -> tuple[Path, ...]:
+    """Return the task directories (those with tests/test.sh) directly under dataset_path."""
+    return _scan_task_dirs(str(dataset_path), dataset_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _scan_task_dirs(dataset_path: str, mtime_ns: int) -> tuple[Path, ...]:
+    # mtime_ns is only part of the cache key: adding or removing a task dir bumps
+    # it, so _resolve_paths and _run_batch_mode share one scan per dataset state.
+    with os.scandir(dataset_path) as it:
+        return tuple(
+            Path(entry.path)
+            for entry in it
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, "tests", "test.sh"))
+        )
+
+
 # ============================================================================
 # SINGLE TASK MODE
 # ============================================================================
 
 
-def _run_single_mode(args: ValidateArgs, dataset_path: Path, task_id: str, task_dir: Path) -> None:
+def _run_single_mode(
+    args: ValidateArgs, dataset_path: Path, task_id: str, task_dir: Path, jobs_dir: Path
+) -> None:
     """Validate a single task with traditional output."""
-    jobs_dir = args.jobs_dir.resolve()
-    jobs_dir.mkdir(parents=True, exist_ok=True)
-
     # Run regular validation
     print("[validate] Running regular validation...")
     nop_reward, oracle_reward = _run_agents(
@@ -193,16 +255,13 @@ def _run_network_isolated(
 # ============================================================================
 
 
-def _run_batch_mode(args: ValidateArgs, dataset_path: Path) -> None:
+def _run_batch_mode(args: ValidateArgs, dataset_path: Path, jobs_dir: Path) -> None:
     """Validate all tasks in parallel with clean output."""
-    console = Console()
-    jobs_dir = args.jobs_dir.resolve()
-    jobs_dir.mkdir(parents=True, exist_ok=True)
+    # Plain status text only: skip Rich's per-print highlighting of numbers/paths
+    console = Console(highlight=False)
 
     # Find tasks
-    task_dirs = [
-        d for d in dataset_path.iterdir() if d.is_dir() and (d / "tests" / "test.sh").exists()
-    ]
+    task_dirs = list(_find_task_dirs(dataset_path))
     if not task_dirs:
         console.print("[yellow]No tasks found[/yellow]")
         return
@@ -225,6 +284,8 @@ def _run_batch_mode(args: ValidateArgs, dataset_path: Path) -> None:
             args.environment,
             console,
             args.output_file,
+            args.quiet,
+            args.show_passed,
         )
     )
 
@@ -232,10 +293,31 @@ def _run_batch_mode(args: ValidateArgs, dataset_path: Path) -> None:
     _print_results(results, args.agent, args.show_passed, console)
 
     # Exit with failure if any tasks failed
-    if not all(r.passed for r in results):
+    if results.failed or results.errors:
         sys.exit(1)
 
 
+_harbor_pool: ThreadPoolExecutor | None = None
+_harbor_pool_size = 0
+
+
+def _harbor_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Process-wide pool for batch Harbor runs, reused across batches of the same width.
+
+    Harbor calls block on subprocesses, so they get their own pool sized to the
+    worker count instead of the loop's default (min(32, cpus + 4)) executor. A batch
+    of a different width shuts the old pool down before replacing it. Worker threads
+    are joined at interpreter exit, so in-flight runs still finish.
+    """
+    global _harbor_pool, _harbor_pool_size
+    if _harbor_pool is None or _harbor_pool_size != max_workers:
+        if _harbor_pool is not None:
+            _harbor_pool.shutdown(wait=True)
+        _harbor_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="harbor-val")
+        _harbor_pool_size = max_workers
+    return _harbor_pool
+
+
 async def _validate_batch(
     task_dirs: list[Path],
     dataset_path: Path,
@@ -246,97 +328,98 @@ async def _validate_batch(
     environment: EnvironmentType,
     console: Console,
     output_file: Path | None = None,
-) -> list[ValidationResult]:
+    quiet: bool = False,
+    show_passed: bool = False,
+) -> BatchResults:
     """Run validations in parallel with progress bar."""
-    semaphore = asyncio.Semaphore(max_parallel)
+    run_nop = agent in ("nop", "both")
+    run_oracle = agent in ("oracle", "both")
+    executor = _harbor_executor(max_parallel)
+    loop = asyncio.get_running_loop()
+
+    # Everything but the task ID is fixed for the batch, so bind it once.
+    # capture_output=True suppresses Harbor's verbose output.
+    harbor_args = {
+        "dataset_path": dataset_path,
+        "jobs_dir": jobs_dir,
+        "timeout_multiplier": timeout_multiplier,
+        "capture_output": True,
+        "environment": environment,
+    }
+    # When running both, keep image for nop so oracle can reuse it
+    run_nop_agent = functools.partial(
+        run_harbor_agent, agent="nop", delete_after=not run_oracle, **harbor_args
+    )
+    # Oracle always deletes (cleanup)
+    run_oracle_agent = functools.partial(
+        run_harbor_agent, agent="oracle", delete_after=True, **harbor_args
+    )
 
-    # Lock and file handle for sequential writes
-    write_lock = asyncio.Lock()
+    # File handle for results; only the event-loop thread writes to it
     file_handle = None
     if output_file:
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handle = open(output_file, "w")
+        # Buffered: results are flushed in batches rather than after every line
+        file_handle = open(output_file, "w", buffering=_OUTPUT_BUFFER_BYTES)
         # Write header
         file_handle.write(f"# Validation results - {len(task_dirs)} tasks\n")
         file_handle.write("# Format: TASK_ID: NOP=<reward> ORACLE=<reward> <STATUS>\n\n")
         file_handle.flush()
 
-    async def write_result(result: ValidationResult) -> None:
-        """Write a single result to file (thread-safe)."""
-        if file_handle is None:
-            return
-        async with write_lock:
-            line = _format_result_line(result, agent)
-            file_handle.write(line + "\n")
-            file_handle.flush()  # Ensure immediate write to disk
-
     async def validate_one(task_dir: Path) -> ValidationResult:
-        async with semaphore:
-            try:
-                nop_reward = oracle_reward = None
-                nop_code = oracle_code = 0
-
-                # Run NOP (capture_output=True to suppress Harbor's verbose output)
-                if agent in ("nop", "both"):
-                    # When running both, keep image for nop so oracle can reuse it
-                    delete_after = agent == "nop"  # Only delete if ONLY running nop
-                    nop_code, job = await asyncio.to_thread(
-                        run_harbor_agent,
-                        task_dir.name,
-                        dataset_path,
-                        jobs_dir,
-                        "nop",
-                        timeout_multiplier,
-                        True,
-                        delete_after,
-                        environment,
-                    )
-                    nop_reward = parse_harbor_outcome(job).reward
-
-                # Run Oracle (capture_output=True to suppress Harbor's verbose output)
-                if agent in ("oracle", "both"):
-                    # Oracle always deletes (cleanup)
-                    oracle_code, job = await asyncio.to_thread(
-                        run_harbor_agent,
-                        task_dir.name,
-                        dataset_path,
-                        jobs_dir,
-                        "oracle",
-                        timeout_multiplier,
-                        True,
-                        True,
-                        environment,
-                    )
-                    oracle_reward = parse_harbor_outcome(job).reward
-
-                # Determine pass/fail
-                passed = _check_passed(agent, nop_reward, oracle_reward)
-
-                result = ValidationResult(
-                    task_id=task_dir.name,
-                    nop_reward=nop_reward,
-                    oracle_reward=oracle_reward,
-                    nop_exit_code=nop_code,
-                    oracle_exit_code=oracle_code,
-                    passed=passed,
-                )
-            except Exception as e:
-                result = ValidationResult(
-                    task_id=task_dir.name,
-                    nop_reward=None,
-                    oracle_reward=None,
-                    nop_exit_code=-1,
-                    oracle_exit_code=-1,
-                    passed=False,
-                    error=str(e),
+        try:
+            nop_reward = oracle_reward = None
+            nop_code = oracle_code = 0
+
+            # NOP and Oracle stay sequential per task: NOP builds and keeps the image,
+            # Oracle reuses it and deletes it, so overlapping them would build twice and
+            # could delete the image under NOP. Throughput comes from the workers, which
+            # already keep max_parallel Harbor runs busy across tasks.
+
+            if run_nop:
+                nop_code, job = await loop.run_in_executor(executor, run_nop_agent, task_dir.name)
+                nop_reward = parse_harbor_outcome(job).reward
+
+            if run_oracle:
+                oracle_code, job = await loop.run_in_executor(
+                    executor, run_oracle_agent, task_dir.name
                 )
-
-            # Write to file immediately
-            await write_result(result)
-            return result
+                oracle_reward = parse_harbor_outcome(job).reward
+
+            # Determine pass/fail
+            passed = _check_passed(run_nop, run_oracle, nop_reward, oracle_reward)
+
+            result = ValidationResult(
+                task_id=task_dir.name,
+                nop_reward=nop_reward,
+                oracle_reward=oracle_reward,
+                nop_exit_code=nop_code,
+                oracle_exit_code=oracle_code,
+                passed=passed,
+            )
+        except Exception as e:
+            result = ValidationResult(
+                task_id=task_dir.name,
+                nop_reward=None,
+                oracle_reward=None,
+                nop_exit_code=-1,
+                oracle_exit_code=-1,
+                passed=False,
+                error=str(e),
+            )
+
+        # Write to file as soon as the task finishes
+        if file_handle is not None:
+            _write_result_sync(file_handle, result, run_nop, run_oracle)
+        return result
+
+    # Only max_parallel workers are live; each pulls the next task dir off the queue.
+    queue: asyncio.Queue[Path] = asyncio.Queue()
+    for d in task_dirs:
+        queue.put_nowait(d)
 
     # Run with progress bar
-    results = []
+    results = BatchResults(keep_passed=show_passed)
     try:
         with Progress(
             SpinnerColumn(),
@@ -344,43 +427,87 @@ async def _validate_batch(
             BarColumn(),
             TaskProgressColumn(),
             console=console,
+            refresh_per_second=_PROGRESS_REFRESH_PER_SECOND,
+            disable=quiet,
         ) as progress:
             task_prog = progress.add_task("[cyan]Validating tasks...", total=len(task_dirs))
 
-            for coro in asyncio.as_completed([validate_one(d) for d in task_dirs]):
-                results.append(await coro)
-                progress.update(task_prog, advance=1)
+            async def worker() -> None:
+                while not queue.empty():
+                    results.add(await validate_one(queue.get_nowait()))
+                    if file_handle and len(results) % _OUTPUT_FLUSH_EVERY == 0:
+                        file_handle.flush()
+
+            async def ticker() -> None:
+                # Push progress on a timer instead of once per task, so a burst of
+                # completions costs one update rather than one per result.
+                while True:
+                    await asyncio.sleep(_PROGRESS_TICK_S)
+                    progress.update(task_prog, completed=len(results))
+
+            ticker_task = asyncio.create_task(ticker())
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    for _ in range(min(max_parallel, len(task_dirs))):
+                        tg.create_task(worker())
+            finally:
+                ticker_task.cancel()
+                progress.update(task_prog, completed=len(results))
     finally:
         if file_handle:
             # Write summary at end
-            passed = sum(1 for r in results if r.passed and not r.error)
-            failed = sum(1 for r in results if not r.passed and not r.error)
-            errors = sum(1 for r in results if r.error)
-            file_handle.write(f"\n# Summary: {passed} passed, {failed} failed, {errors} errors\n")
+            file_handle.write(
+                f"\n# Summary: {results.n_passed} passed, {len(results.failed)} failed, "
+                f"{len(results.errors)} errors\n"
+            )
+            file_handle.flush()
             file_handle.close()
 
     return results
 
 
-def _format_result_line(result: ValidationResult, agent: str) -> str:
-    """Format a single result as a text line."""
-    parts = [result.task_id + ":"]
+def _write_result_sync(
+    file_handle: TextIO, result: ValidationResult, run_nop: bool, run_oracle: bool
+) -> None:
+    """Append one result line. No await, so writes can't interleave on the loop."""
+    file_handle.write(_format_result_line(result, run_nop, run_oracle) + "\n")
 
-    if agent in ("nop", "both"):
-        if result.nop_reward is not None:
-            parts.append(f"NOP={result.nop_reward}")
+
+def _format_result_line(result: ValidationResult, run_nop: bool, run_oracle: bool) -> str:
+    """Format a single result as a text line."""
+    tail = _format_result_tail(
+        run_nop, run_oracle, result.nop_reward, result.oracle_reward, result.passed, result.error
+    )
+    return f"{result.task_id}: {tail}"
+
+
+@functools.lru_cache(maxsize=64)
+def _format_result_tail(
+    run_nop: bool,
+    run_oracle: bool,
+    nop_reward: float | None,
+    oracle_reward: float | None,
+    passed: bool,
+    error: str | None,
+) -> str:
+    # Everything after the task ID; a healthy batch repeats a handful of these.
+    parts = []
+
+    if run_nop:
+        if nop_reward is not None:
+            parts.append(f"NOP={nop_reward}")
         else:
             parts.append("NOP=ERROR")
 
-    if agent in ("oracle", "both"):
-        if result.oracle_reward is not None:
-            parts.append(f"ORACLE={result.oracle_reward}")
+    if run_oracle:
+        if oracle_reward is not None:
+            parts.append(f"ORACLE={oracle_reward}")
         else:
             parts.append("ORACLE=ERROR")
 
-    if result.error:
-        parts.append(f"ERROR: {result.error}")
-    elif result.passed:
+    if error:
+        parts.append(f"ERROR: {error}")
+    elif passed:
         parts.append("PASS")
     else:
         parts.append("FAIL")
@@ -388,71 +515,76 @@ def _format_result_line(result: ValidationResult, agent: str) -> str:
     return " ".join(parts)
 
 
-def _check_passed(agent: str, nop_reward: float | None, oracle_reward: float | None) -> bool:
-    """Check if validation passed based on agent type and rewards."""
-    if agent == "both":
-        return nop_reward == 0 and oracle_reward == 1
-    elif agent == "nop":
-        return nop_reward == 0
-    elif agent == "oracle":
-        return oracle_reward == 1
-    return False
+def _check_passed(
+    run_nop: bool, run_oracle: bool, nop_reward: float | None, oracle_reward: float | None
+) -> bool:
+    """Check if validation passed based on which agents ran and their rewards."""
+    return (not run_nop or nop_reward == 0) and (not run_oracle or oracle_reward == 1)
 
 
-def _print_results(
-    results: list[ValidationResult], agent: str, show_passed: bool, console: Console
-) -> None:
+def _print_results(results: BatchResults, agent: str, show_passed: bool, console: Console) -> None:
     """Print results table (failures only by default) and summary."""
-    passed = [r for r in results if r.passed and not r.error]
-    failed = [r for r in results if not r.passed and not r.error]
-    errors = [r for r in results if r.error]
+    failed, errors = results.failed, results.errors
 
     # Show table if there are failures/errors or if show_passed requested
     if failed or errors or show_passed:
-        table = Table(
-            title="Validation Failures" if not show_passed else "Validation Results",
-            title_style="bold cyan",
-            show_lines=True,
-        )
-        table.add_column("Task ID", style="cyan")
-
-        if agent in ("nop", "both"):
-            table.add_column("NOP", justify="center")
-        if agent in ("oracle", "both"):
-            table.add_column("Oracle", justify="center")
-
-        table.add_column("Status", justify="center")
-        table.add_column("Notes")
-
-        # Show errors, then failures, then passed (if requested)
-        for result in sorted(
-            errors + failed + (passed if show_passed else []), key=lambda r: r.task_id
-        ):
-            _add_result_row(table, result, agent)
-
         console.print("\n")
-        console.print(table)
+        console.print(_build_results_table(results, agent, show_passed))
 
     # Always show summary
     console.print("\n[bold]Summary:[/bold]")
-    console.print(f"  ✅ Passed: {len(passed)}")
+    console.print(f"  ✅ Passed: {results.n_passed}")
     console.print(f"  ❌ Failed: {len(failed)}")
     console.print(f"  ⚠️  Errors: {len(errors)}")
     console.print(f"  📊 Total: {len(results)}")
 
     if not failed and not errors:
-        console.print(f"\n[bold green]🎉 All {len(passed)} task(s) passed validation![/bold green]")
+        console.print(
+            f"\n[bold green]🎉 All {results.n_passed} task(s) passed validation![/bold green]"
+        )
+
 
+def _build_results_table(results: BatchResults, agent: str, show_passed: bool) -> Table:
+    """Build the results table (errors and failures, plus passes if requested)."""
+    run_nop = agent in ("nop", "both")
+    run_oracle = agent in ("oracle", "both")
+
+    table = Table(
+        title="Validation Failures" if not show_passed else "Validation Results",
+        title_style="bold cyan",
+        show_lines=True,
+    )
+    table.add_column("Task ID", style="cyan")
 
-def _add_result_row(table: Table, result: ValidationResult, agent: str) -> None:
+    if run_nop:
+        table.add_column("NOP", justify="center")
+    if run_oracle:
+        table.add_column("Oracle", justify="center")
+
+    table.add_column("Status", justify="center")
+    table.add_column("Notes")
+
+    # Show errors, then failures, then passed (if requested)
+    for result in sorted(
+        results.errors + results.failed + results.passed,
+        key=lambda r: r.task_id,
+    ):
+        _add_result_row(table, result, run_nop, run_oracle)
+
+    return table
+
+
+def _add_result_row(
+    table: Table, result: ValidationResult, run_nop: bool, run_oracle: bool
+) -> None:
     """Add a single result row to the table."""
     row = [result.task_id]
 
     if result.error:
         # Error row
-        if agent in ("nop", "both"):
+        if run_nop:
             row.append("?")
-        if agent in ("oracle", "both"):
+        if run_oracle:
             row.append("?")
         row.extend(["❌ ERROR", result.error])
         table.add_row(*row, style="red")
@@ -460,9 +592,9 @@ def _add_result_row(table: Table, result: ValidationResult, agent: str) -> None:
 
     if result.passed:
         # Passed row (only shown if show_passed=True)
-        if agent in ("nop", "both"):
+        if run_nop:
             row.append(f"✓ ({result.nop_reward})" if result.nop_reward is not None else "—")
-        if agent in ("oracle", "both"):
+        if run_oracle:
             row.append(f"✓ ({result.oracle_reward})" if result.oracle_reward is not None else "—")
         row.extend(["✅ PASS", ""])
         table.add_row(*row, style="green")
@@ -471,7 +603,7 @@ def _add_result_row(table: Table, result: ValidationResult, agent: str) -> None:
     # Failed row
     notes = []
 
-    if agent in ("nop", "both"):
+    if run_nop:
         if result.nop_reward is not None:
             row.append(f"{'✓' if result.nop_reward == 0 else '✗'} ({result.nop_reward})")
             if result.nop_reward != 0:
@@ -479,7 +611,7 @@ def _add_result_row(table: Table, result: ValidationResult, agent: str) -> None:
         else:
             row.append("—")
 
-    if agent in ("oracle", "both"):
+    if run_oracle:
         if result.oracle_reward is not None:
             row.append(f"{'✓' if result.oracle_reward == 1 else '✗'} ({result.oracle_reward})")
             if result.oracle_reward != 1:
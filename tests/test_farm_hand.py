@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pytest
+
+from taskgen.farm.farm_hand import _classify_failure
+
+
+@pytest.mark.parametrize(
+    ("stderr", "reason"),
+    [
+        ("PR is trivial", "Trivial PR (skipped)"),
+        ("No linked issue found", "No linked issue (skipped)"),
+        ("MissingIssueError: PR #1", "No linked issue (skipped)"),
+        ("Harbor validation failed", "Validation failed (NOP or Oracle)"),
+        ("Task already exists: foo", "Task already exists (skipped)"),
+        ("FileExistsError: [Errno 17] File exists", "Task already exists (skipped)"),
+        ("no test files changed", "No tests detected"),
+        (
+            "GitHub API: rate limit exceeded",
+            "GitHub API rate limit exceeded (set GITHUB_TOKEN)",
+        ),
+        (
+            "Rate limit exceeded\nwhile calling api.github.com",
+            "GitHub API rate limit exceeded (set GITHUB_TOKEN)",
+        ),
+        ("Error code: 429 - insufficient_quota", "OpenAI API quota exceeded (check billing)"),
+        ("Command timed out after 600s", "Command timed out"),
+        ("TimeoutError", "Command timed out"),
+        (
+            "cannot checkout commit abc123",
+            "Git commit not found (may be force-pushed or deleted)",
+        ),
+        ("git checkout failed", "Git checkout failed (repo cache may be corrupted)"),
+    ],
+)
+def test_classify_failure(stderr: str, reason: str) -> None:
+    assert _classify_failure(stderr) == reason
+
+
+def test_classify_failure_first_rule_wins() -> None:
+    assert _classify_failure("trivial PR; harbor validation timed out") == "Trivial PR (skipped)"
+
+
+@pytest.mark.parametrize("stderr", ["TrivialPRError", "No tests"])
+def test_classify_failure_case_sensitive_rules(stderr: str) -> None:
+    assert _classify_failure(stderr) == stderr
+
+
+def test_classify_failure_passes_unknown_errors_through() -> None:
+    assert _classify_failure("boom\nat line 3") == "boom at line 3"
+    assert _classify_failure("") == "Unknown error"
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from taskgen.farm.state import StreamState, _decode_pr_bitmap, _encode_pr_bitmap
+
+
+@pytest.mark.parametrize(
+    "prs",
+    [
+        set(),
+        {0},
+        {7, 8},
+        {1, 2, 3, 100, 4097},
+        set(range(0, 20000, 3)),
+    ],
+)
+def test_pr_bitmap_round_trip(prs: set[int]) -> None:
+    assert _decode_pr_bitmap(_encode_pr_bitmap(prs)) == prs
+
+
+def test_pr_bitmap_empty_is_empty_string() -> None:
+    assert _encode_pr_bitmap(set()) == ""
+
+
+def test_state_dict_round_trip() -> None:
+    state = StreamState(repo="owner/repo")
+    state.mark_processed(12, "2024-01-02T00:00:00Z", success=True)
+    state.mark_processed(9, "2024-01-01T00:00:00Z", success=False)
+
+    data = state.to_dict()
+    assert "processed_prs" not in data
+    loaded = StreamState.from_dict(data)
+
+    assert loaded.processed_prs == {9, 12}
+    assert (loaded.total_processed, loaded.successful, loaded.failed) == (2, 1, 1)
+    assert loaded.last_pr_number == 9
+    assert loaded.last_created_at == "2024-01-01T00:00:00Z"
+
+
+def test_from_dict_reads_legacy_pr_list() -> None:
+    loaded = StreamState.from_dict(
+        {"repo": "owner/repo", "processed_prs": [5, 3, 5], "total_processed": 3}
+    )
+    assert loaded.processed_prs == {3, 5}
+    assert loaded.total_processed == 3
+
+
+def test_mark_processed_without_created_at_keeps_resume_point() -> None:
+    state = StreamState(repo="owner/repo")
+    state.mark_processed(2, "2024-01-02T00:00:00Z", success=True)
+    state.mark_processed(1, None, success=True)
+    assert state.last_created_at == "2024-01-02T00:00:00Z"
+    assert state.processed_prs == {1, 2}
+
+
+def test_save_then_load(tmp_path) -> None:
+    state_file = tmp_path / "state" / "owner__repo.json"
+    state = StreamState(repo="owner/repo")
+    state.mark_processed(42, "2024-01-01T00:00:00Z", success=True)
+    state.save(state_file)
+
+    assert [p.name for p in state_file.parent.iterdir()] == [state_file.name]
+    assert StreamState.load(state_file, "owner/repo").processed_prs == {42}
+
+
+def test_load_legacy_file(tmp_path) -> None:
+    state_file = tmp_path / "state.json"
+    state_file.write_text(json.dumps({"repo": "owner/repo", "processed_prs": [1, 2]}))
+    assert StreamState.load(state_file, "owner/repo").processed_prs == {1, 2}
+
+
+@pytest.mark.parametrize("content", ['{"repo": "other/repo"}', "not json"])
+def test_load_starts_fresh_on_mismatch_or_corruption(tmp_path, content: str) -> None:
+    state_file = tmp_path / "state.json"
+    state_file.write_text(content)
+    state = StreamState.load(state_file, "owner/repo")
+    assert state.repo == "owner/repo"
+    assert state.processed_prs == set()
+
+
+def test_maybe_save_skips_clean_state(tmp_path) -> None:
+    state_file = tmp_path / "state.json"
+    assert not StreamState(repo="owner/repo").maybe_save(state_file)
+    assert not state_file.exists()
+
+
+def test_maybe_save_debounces_until_every_n(tmp_path) -> None:
+    state_file = tmp_path / "state.json"
+    state = StreamState(repo="owner/repo")
+    state.save(state_file)
+
+    for pr in range(1, 3):
+        state.mark_processed(pr, None, success=True)
+        assert not state.maybe_save(state_file, min_interval_s=3600, every_n=3)
+    state.mark_processed(3, None, success=True)
+    assert state.maybe_save(state_file, min_interval_s=3600, every_n=3)
+    assert StreamState.load(state_file, "owner/repo").processed_prs == {1, 2, 3}
+
+
+def test_maybe_save_after_interval(tmp_path, monkeypatch) -> None:
+    clock = [1000.0]
+    monkeypatch.setattr("taskgen.farm.state.time.monotonic", lambda: clock[0])
+    state_file = tmp_path / "state.json"
+    state = StreamState(repo="owner/repo")
+    state.save(state_file)
+
+    state.mark_processed(1, None, success=True)
+    assert not state.maybe_save(state_file, min_interval_s=5.0, every_n=100)
+    clock[0] += 5.0
+    assert state.maybe_save(state_file, min_interval_s=5.0, every_n=100)
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pytest
+
+from taskgen.tools.network_isolation import NETWORK_ISOLATION_OVERRIDE, network_isolation
+
+
+def test_creates_and_removes_override(tmp_path) -> None:
+    with network_isolation(tmp_path) as override:
+        assert override.read_text() == NETWORK_ISOLATION_OVERRIDE
+    assert not override.exists()
+
+
+def test_removes_override_on_error(tmp_path) -> None:
+    with pytest.raises(RuntimeError), network_isolation(tmp_path) as override:
+        raise RuntimeError
+    assert not override.exists()
+
+
+def test_leaves_existing_override_alone(tmp_path) -> None:
+    existing = "services: {}\n"
+    with network_isolation(tmp_path) as override:
+        with network_isolation(tmp_path) as nested:
+            assert nested == override
+        # The inner context did not create the file, so it must not delete it
+        assert override.read_text() == NETWORK_ISOLATION_OVERRIDE
+
+    override.write_text(existing)
+    with network_isolation(tmp_path):
+        assert override.read_text() == existing
+    assert override.read_text() == existing
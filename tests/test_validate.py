@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from taskgen.tools.validate import BatchResults, ValidationResult
+
+
+def _result(task_id: str, passed: bool, error: str | None = None) -> ValidationResult:
+    return ValidationResult(
+        task_id=task_id,
+        nop_reward=0.0,
+        oracle_reward=1.0 if passed else 0.0,
+        nop_exit_code=0,
+        oracle_exit_code=0,
+        passed=passed,
+        error=error,
+    )
+
+
+def test_batch_results_buckets_by_outcome() -> None:
+    results = BatchResults()
+    results.add(_result("a", passed=True))
+    results.add(_result("b", passed=False))
+    results.add(_result("c", passed=False, error="boom"))
+    # An error wins over the passed flag
+    results.add(_result("d", passed=True, error="boom"))
+
+    assert len(results) == 4
+    assert results.n_passed == 1
+    assert results.passed == []
+    assert [r.task_id for r in results.failed] == ["b"]
+    assert [r.task_id for r in results.errors] == ["c", "d"]
+
+
+def test_batch_results_keeps_passed_on_request() -> None:
+    results = BatchResults(keep_passed=True)
+    results.add(_result("a", passed=True))
+    assert results.n_passed == 1
+    assert [r.task_id for r in results.passed] == ["a"]